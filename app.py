@@ -2,14 +2,74 @@
 # It uses Tkinter to create the Graphical User Interface (GUI) and connects it
 # to the Genetic Algorithm engine and the benchmark functions.
 
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
-import matplotlib.pyplot as plt
 
 # Import the logic and functions from the other files
-from benchmark_functions import FUNCTIONS
-from genetic_algorithm import GeneticAlgorithm
+from gabench.benchmark_functions import FUNCTIONS
+from gabench.genetic_algorithm import GeneticAlgorithm
+from gabench.history import HistoryRecorder
+
+# How often (in milliseconds) the GUI refreshes while the GA is running
+REFRESH_INTERVAL_MS = 50
+# Most points drawn by the convergence plot, however long the run was
+PLOT_POINTS = 1000
+
+class GAWorker(threading.Thread):
+    """
+    Runs a GeneticAlgorithm in a background thread so the GUI stays responsive.
+    Generations run back to back; at most once per refresh interval the worker
+    puts a snapshot of its progress on a queue for the GUI to display.
+    """
+    def __init__(self, ga_instance, interval=REFRESH_INTERVAL_MS / 1000):
+        super().__init__(daemon=True)
+        self.ga_instance = ga_instance
+        self.interval = interval
+        self.snapshots = queue.Queue()
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """Asks the worker to stop after the generation it is running."""
+        self._stop_event.set()
+
+    def _publish(self, history, done, error=None):
+        """
+        Puts a snapshot on the queue. It carries the best fitness of every
+        generation since the previous snapshot, so no history is lost. The
+        final snapshot carries the exception that ended the run, if any.
+        """
+        ga = self.ga_instance
+        best_solution = None if ga.best_solution is None else np.array(ga.best_solution)
+        self.snapshots.put({
+            "generation": ga.generation,
+            "best_fitness": ga.best_fitness,
+            "best_solution": best_solution,
+            "history": history,
+            "done": done,
+            "stop_reason": ga.stop_reason,
+            "error": error,
+        })
+
+    def run(self):
+        history = []
+        last_publish = time.perf_counter()
+        try:
+            while not self._stop_event.is_set() and not self.ga_instance.should_stop():
+                _, best_fitness = self.ga_instance.run_generation()
+                history.append(float(best_fitness))
+                if time.perf_counter() - last_publish >= self.interval:
+                    self._publish(history, done=False)
+                    history = []
+                    last_publish = time.perf_counter()
+        except Exception as error:
+            # E.g. from the objective function: end the run and let the GUI report it
+            self._publish(history, done=True, error=error)
+            return
+        self._publish(history, done=True)
 
 class App(tk.Tk):
     """
@@ -35,9 +95,11 @@ class App(tk.Tk):
 
         # --- Class Members ---
         self.ga_instance = None
+        self.worker = None
         self.running = False
         self.generation_count = 0
-        self.fitness_history = [] # To store fitness values for plotting
+        # Downsampled best fitness per generation, for plotting
+        self.fitness_history = HistoryRecorder(max_points=PLOT_POINTS, keep_full=False)
 
         # --- GUI Creation ---
         self._create_widgets()
@@ -62,7 +124,7 @@ class App(tk.Tk):
         # Dimension Selection
         ttk.Label(control_frame, text="Dimension:").pack(anchor="w", pady=(10, 2))
         self.dimension_var = tk.StringVar(value="5")
-        dimension_menu = ttk.Combobox(control_frame, textvariable=self.dimension_var, values=["5", "10"], state="readonly")
+        dimension_menu = ttk.Combobox(control_frame, textvariable=self.dimension_var, values=["2", "5", "10", "30", "100", "1000", "10000"], state="readonly")
         dimension_menu.pack(fill=tk.X)
         
         # Other GA Parameters
@@ -111,24 +173,29 @@ class App(tk.Tk):
             func_name = self.function_var.get()
             dimension = int(self.dimension_var.get())
             pop_size = int(self.pop_size_var.get())
+            max_generations = int(self.max_gen_var.get())
             
             self.ga_instance = GeneticAlgorithm(
                 objective_func=FUNCTIONS[func_name]["func"],
                 bounds=FUNCTIONS[func_name]["bounds"],
                 dimension=dimension,
-                pop_size=pop_size
+                pop_size=pop_size,
+                max_generations=max_generations,
+                target_fitness=FUNCTIONS[func_name]["optimum"]
             )
 
             # Reset state and update UI
             self.running = True
             self.generation_count = 0
-            self.fitness_history.clear() # Clear history for the plot
+            self.fitness_history = HistoryRecorder(max_points=PLOT_POINTS, keep_full=False) # Clear history for the plot
             self.start_button.config(state=tk.DISABLED)
             self.stop_button.config(state=tk.NORMAL)
             self.plot_button.config(state=tk.DISABLED)
             
-            # Start the GA loop
-            self.run_ga_loop()
+            # Run the GA in the background and poll it for progress
+            self.worker = GAWorker(self.ga_instance)
+            self.worker.start()
+            self.after(REFRESH_INTERVAL_MS, self.poll_worker, self.worker)
 
         except ValueError:
             messagebox.showerror("Input Error", "Population size and max generations must be valid integers.")
@@ -136,44 +203,74 @@ class App(tk.Tk):
     def stop_ga(self):
         """Stops the Genetic Algorithm run."""
         self.running = False
+        if self.worker is not None:
+            self.worker.stop()
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.plot_button.config(state=tk.NORMAL) # Enable plot button when stopped
 
 
-    def run_ga_loop(self):
-        """The main loop that runs generations and updates the GUI."""
-        if self.running and self.generation_count < int(self.max_gen_var.get()):
-            best_solution, best_fitness = self.ga_instance.run_generation()
-            self.fitness_history.append(best_fitness) # Add data for plot
-            
+    def poll_worker(self, worker):
+        """
+        Shows the latest progress of the background GA run. Runs at a fixed
+        rate on the Tk main thread; only the newest snapshot is drawn.
+        """
+        if worker is not self.worker:
+            return # A newer run has replaced this one
+
+        latest = None
+        while True:
+            try:
+                snapshot = worker.snapshots.get_nowait()
+            except queue.Empty:
+                break
+            self.fitness_history.extend(snapshot["history"]) # Add data for plot
+            latest = snapshot
+
+        if latest is not None and latest["best_solution"] is not None:
             # Update GUI
-            self.generation_count += 1
+            self.generation_count = latest["generation"]
             self.gen_label.config(text=f"Generation: {self.generation_count}")
-            self.fitness_label.config(text=f"Best Fitness: {best_fitness:.6f}")
+            self.fitness_label.config(text=f"Best Fitness: {latest['best_fitness']:.6f}")
             
             self.solution_text.config(state=tk.NORMAL)
             self.solution_text.delete("1.0", tk.END)
-            solution_str = np.array2string(best_solution, formatter={'float_kind':lambda x: "%.4f" % x})
+            solution_str = np.array2string(latest["best_solution"], formatter={'float_kind':lambda x: "%.4f" % x})
             self.solution_text.insert(tk.END, solution_str)
             self.solution_text.config(state=tk.DISABLED)
-            
-            # Schedule the next run
-            self.after(1, self.run_ga_loop)
-        else:
-            if self.running: # If it finished without being stopped
+
+        if latest is not None and latest["done"]:
+            if latest["error"] is not None:
+                self.gen_label.config(text=f"Generation: {self.generation_count} (failed)")
+                if self.running:
+                    self.stop_ga()
+                error = latest["error"]
+                messagebox.showerror("GA Error", f"The run failed: {type(error).__name__}: {error}")
+                return
+            if latest["stop_reason"] is not None: # If it finished without being stopped
+                self.gen_label.config(text=f"Generation: {self.generation_count} (stopped: {latest['stop_reason']})")
+            if self.running:
                 self.stop_ga()
+        else:
+            # Schedule the next refresh
+            self.after(REFRESH_INTERVAL_MS, self.poll_worker, worker)
 
     def plot_convergence(self):
         """Plots the fitness history of the last GA run."""
-        if not self.fitness_history:
+        if len(self.fitness_history) == 0:
             messagebox.showinfo("No Data", "There is no fitness data to plot. Please run the GA first.")
             return
 
+        # Imported here so the GUI starts without loading matplotlib
+        import matplotlib.pyplot as plt
+
         plt.style.use('seaborn-v0_8-darkgrid')
         fig, ax = plt.subplots(figsize=(10, 6))
         
-        ax.plot(self.fitness_history, color='cyan', linewidth=2)
+        # Each point covers a bucket of generations: draw its min-max range and its best value
+        generations, low, high = self.fitness_history.downsampled()
+        ax.fill_between(generations, low, high, step='post', color='cyan', alpha=0.3, linewidth=0)
+        ax.plot(generations, low, color='cyan', linewidth=2, drawstyle='steps-post')
         
         # Style the plot to match the dark theme
         fig.patch.set_facecolor('#2E2E2E')
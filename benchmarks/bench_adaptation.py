@@ -0,0 +1,79 @@
+# Benchmark of the adaptive strategies (adaptation.py) against the fixed
+# operators: a mutation step of 0.1 whatever the bounds, and fixed crossover
+# and mutation rates. Every strategy gets the same budget of objective
+# evaluations on every benchmark function. The first table shows the mean
+# evaluations the runs needed to get within 1e-3 of the known optimum (and
+# how many runs got there), the second the mean best fitness at the end of
+# the run, which also covers Shekel, whose optimum is not known. All seeds
+# of a strategy run together as one MultiRunGA, each adapting on its own.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_adaptation
+
+import argparse
+
+import numpy as np
+
+from gabench.adaptation import OneFifthRule, ScaledStep, SelfAdaptiveStep, SuccessRateAdaptation
+from gabench.benchmark_functions import FUNCTIONS
+from gabench.genetic_algorithm import TARGET_TOLERANCE
+from gabench.multi_run import MultiRunGA
+from gabench.results import format_evaluations_to_target
+
+STRATEGIES = {
+    "fixed (step 0.1)": {},
+    "scaled step 1%": {"mutation_step": ScaledStep(0.01)},
+    "1/5th rule": {"mutation_step": OneFifthRule()},
+    "1/5th rule, 0.4": {"mutation_step": OneFifthRule(target=0.4)},
+    "self-adaptive": {"mutation_step": SelfAdaptiveStep()},
+    "self-adaptive/gene": {"mutation_step": SelfAdaptiveStep(per_gene=True)},
+    "adaptive rates": {"rate_adaptation": SuccessRateAdaptation()},
+    "self-adapt. + rates": {"mutation_step": SelfAdaptiveStep(), "rate_adaptation": SuccessRateAdaptation()},
+}
+
+def run_strategy(info, args, kwargs):
+    """Runs all seeds of one strategy on one function and returns the MultiRunGA."""
+    ga = MultiRunGA(info["func"], info["bounds"], args.dimension, n_runs=args.seeds, pop_size=args.pop_size,
+                    seed=args.seed, max_evaluations=args.evaluations, target_fitness=info["optimum"],
+                    target_tolerance=TARGET_TOLERANCE, **kwargs)
+    ga.run()
+    return ga
+
+def print_table(title, functions, rows):
+    print(f"\n{title}")
+    print("| Strategy            | " + " | ".join(f"{name:<13}" for name in functions) + " |")
+    print("|---------------------|" + "|".join("-" * 15 for _ in functions) + "|")
+    for name, cells in rows.items():
+        print(f"| {name:<19} | " + " | ".join(f"{cell:<13}" for cell in cells) + " |")
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaptive strategies vs fixed operators at a fixed evaluation budget.")
+    parser.add_argument("--functions", nargs="+", default=list(FUNCTIONS.keys()))
+    parser.add_argument("--dimension", type=int, default=10)
+    parser.add_argument("--pop-size", type=int, default=100)
+    parser.add_argument("--evaluations", type=int, default=100_000, help="Evaluation budget of each run.")
+    parser.add_argument("--seeds", type=int, default=5, help="Runs per strategy and function.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"Adaptation benchmark: {args.dimension}D, population {args.pop_size}, "
+          f"{args.evaluations} evaluations, {args.seeds} runs each")
+    to_target, final = {}, {}
+    for name, kwargs in STRATEGIES.items():
+        to_target[name], final[name] = [], []
+        for func_name in args.functions:
+            info = FUNCTIONS[func_name]
+            ga = run_strategy(info, args, kwargs)
+            if info["optimum"] is None:
+                to_target[name].append("n/a")
+            else:
+                reached = [None if np.isnan(e) else e for e in ga.evaluations_to_target]
+                to_target[name].append(format_evaluations_to_target(reached))
+            final[name].append(f"{np.mean(ga.best_fitness):.4g}")
+
+    print_table("Mean evaluations to reach the optimum (runs that reached it)", args.functions, to_target)
+    print_table("Mean best fitness when the runs stopped (budget used up, or every run reached the optimum)",
+                args.functions, final)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Benchmark comparing per-individual (scalar) fitness evaluation with the
+# batched population-matrix variants from benchmark_functions.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_evaluation
+
+import argparse
+import time
+
+import numpy as np
+
+from gabench.benchmark_functions import FUNCTIONS
+
+POP_SIZES = [100, 1_000, 100_000]
+DIMENSION = 10
+
+def time_call(fn, repeats):
+    """Returns the best wall-clock time (in seconds) of `repeats` calls to fn."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Scalar vs batched fitness evaluation benchmark.")
+    parser.add_argument("--dimension", type=int, default=DIMENSION)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"Evaluation benchmark, dimension={args.dimension}")
+    print("| Function      | Pop     | Scalar (s)  | Batched (s) | Speedup   |")
+    print("|---------------|---------|-------------|-------------|-----------|")
+    for func_name, info in FUNCTIONS.items():
+        func = info["func"]
+        min_b, max_b = info["bounds"]
+        for pop_size in POP_SIZES:
+            population = min_b + (max_b - min_b) * rng.random((pop_size, args.dimension))
+
+            scalar = np.array([func(ind) for ind in population])
+            batched = func.batch(population)
+            if not np.array_equal(scalar, batched):
+                raise AssertionError(f"{func_name}: batched result differs from scalar result")
+
+            # The scalar path is slow at large sizes, so time it only once there
+            scalar_repeats = 1 if pop_size >= 100_000 else args.repeats
+            t_scalar = time_call(lambda: [func(ind) for ind in population], scalar_repeats)
+            t_batch = time_call(lambda: func.batch(population), args.repeats)
+            print(f"| {func_name:<13} | {pop_size:<7} | {t_scalar:<11.5f} | {t_batch:<11.5f} | {t_scalar / t_batch:<8.1f}x |")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Benchmark of the evaluator backends on a synthetic slow objective.
+# The 'cpu' objective busy-waits in pure Python (holding the GIL), so it only
+# scales with the process pool; the 'io' objective sleeps (releasing the GIL),
+# so it scales with both pools.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_evaluators --objective cpu
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from gabench.evaluators import ProcessPoolEvaluator, SerialEvaluator, ThreadPoolEvaluator
+
+COST_SECONDS = 0.001
+
+def slow_cpu_sphere(x):
+    """Sphere function that burns about COST_SECONDS of CPU time per call."""
+    end = time.perf_counter() + COST_SECONDS
+    while time.perf_counter() < end:
+        pass
+    return np.sum(np.square(x))
+
+def slow_io_sphere(x):
+    """Sphere function that sleeps for about COST_SECONDS per call."""
+    time.sleep(COST_SECONDS)
+    return np.sum(np.square(x))
+
+OBJECTIVES = {"cpu": slow_cpu_sphere, "io": slow_io_sphere}
+
+def time_evaluator(evaluator, objective, population, generations):
+    """Returns the mean seconds per generation, after one warm-up generation."""
+    evaluator.evaluate(objective, population)
+    start = time.perf_counter()
+    for _ in range(generations):
+        evaluator.evaluate(objective, population)
+    return (time.perf_counter() - start) / generations
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluator backend scaling benchmark.")
+    parser.add_argument("--objective", choices=OBJECTIVES.keys(), default="cpu")
+    parser.add_argument("--pop-size", type=int, default=1000)
+    parser.add_argument("--dimension", type=int, default=10)
+    parser.add_argument("--generations", type=int, default=3)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    objective = OBJECTIVES[args.objective]
+    population = np.random.default_rng(0).random((args.pop_size, args.dimension))
+
+    with SerialEvaluator() as evaluator:
+        serial = time_evaluator(evaluator, objective, population, args.generations)
+    print(f"Evaluator benchmark ({args.objective} objective, {COST_SECONDS * 1000:.1f} ms/call, pop={args.pop_size})")
+    print(f"Serial: {serial:.3f} s/generation")
+    print("| Backend  | Workers | s/generation | Speedup  | Efficiency |")
+    print("|----------|---------|--------------|----------|------------|")
+    workers = 1
+    while workers <= args.max_workers:
+        for name, backend in (("thread", ThreadPoolEvaluator), ("process", ProcessPoolEvaluator)):
+            with backend(workers) as evaluator:
+                elapsed = time_evaluator(evaluator, objective, population, args.generations)
+            speedup = serial / elapsed
+            print(f"| {name:<8} | {workers:<7} | {elapsed:<12.3f} | {speedup:<7.2f}x | {speedup / workers:<10.0%} |")
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
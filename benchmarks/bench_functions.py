@@ -0,0 +1,81 @@
+# Microbenchmark of the per-evaluation cost of every benchmark function, in
+# nanoseconds per individual, for scalar calls and for batched population
+# evaluation. The original Shekel implementation (rebuilding its constant
+# table on every call and looping over its m terms) is included as a
+# baseline, along with the standard Shekel 5/7/10 variants.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_functions
+
+import argparse
+import time
+
+import numpy as np
+
+from gabench.benchmark_functions import FUNCTIONS, shekel5, shekel7, shekel10
+
+DIMENSIONS = [4, 10, 100, 1000]
+
+def legacy_shekel(x):
+    """The original Shekel implementation, kept here as the 'before' baseline."""
+    m = 10
+    C = np.array([4, 1, 8, 6, 3, 2, 5, 8, 6, 7])
+    A = np.array([[c] * 10 for c in C])
+    A_subset = A[:m, :len(x)]
+    result = 0
+    for i in range(m):
+        term = np.sum((x - A_subset[i])**2)
+        result -= 1 / (term + C[i])
+    return result
+
+def legacy_shekel_batch(X):
+    m = 10
+    C = np.array([4, 1, 8, 6, 3, 2, 5, 8, 6, 7])
+    A = np.array([[c] * 10 for c in C])
+    A_subset = A[:m, :X.shape[-1]]
+    result = np.zeros(X.shape[:-1])
+    for i in range(m):
+        result -= 1 / (np.sum((X - A_subset[i])**2, axis=-1) + C[i])
+    return result
+
+legacy_shekel.batch = legacy_shekel_batch
+
+def best_time(fn, repeats):
+    """Returns the best wall-clock time (in seconds) of `repeats` calls to fn."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-evaluation cost of the benchmark functions.")
+    parser.add_argument("--dimensions", nargs="+", type=int, default=DIMENSIONS)
+    parser.add_argument("--pop-size", type=int, default=1000, help="Individuals per batched call.")
+    parser.add_argument("--scalar-calls", type=int, default=200, help="Individuals timed one call at a time.")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    functions = {name: (info["func"], info["bounds"]) for name, info in FUNCTIONS.items()}
+    functions["Shekel (legacy)"] = (legacy_shekel, FUNCTIONS["Shekel"]["bounds"])
+    functions["Shekel 5"] = (shekel5, (0, 10))
+    functions["Shekel 7"] = (shekel7, (0, 10))
+    functions["Shekel 10"] = (shekel10, (0, 10))
+
+    rng = np.random.default_rng(0)
+    print(f"Per-evaluation cost in ns per individual (batches of {args.pop_size})")
+    print("| Function        | Dim   | Scalar ns/eval | Batched ns/eval |")
+    print("|-----------------|-------|----------------|-----------------|")
+    for func_name, (func, (min_b, max_b)) in functions.items():
+        for dimension in args.dimensions:
+            if func is legacy_shekel and dimension > 10:
+                continue  # The original implementation only handled up to 10 dimensions
+            population = min_b + (max_b - min_b) * rng.random((args.pop_size, dimension))
+            rows = population[:args.scalar_calls]
+            t_scalar = best_time(lambda: [func(x) for x in rows], args.repeats) / len(rows)
+            t_batch = best_time(lambda: func.batch(population), args.repeats) / len(population)
+            print(f"| {func_name:<15} | {dimension:<5} | {t_scalar * 1e9:<14.0f} | {t_batch * 1e9:<15.1f} |")
+
+if __name__ == "__main__":
+    main()
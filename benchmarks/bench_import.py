@@ -0,0 +1,74 @@
+# Import-time benchmark of the project's entry points and of the gabench core
+# package, measured with `python -X importtime` in a fresh interpreter per
+# import. Interpreter startup (the modules imported by `python -c pass`) is
+# not counted. Also reports which of the heavy optional modules (tkinter,
+# matplotlib, multiprocessing) each import pulls in, to check that headless
+# use of the engine only pays for NumPy.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_import
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# The statement timed for each row; the last two are the GUI's old eager imports
+IMPORTS = [
+    ("numpy", "import numpy"),
+    ("gabench", "import gabench"),
+    ("gabench.genetic_algorithm", "import gabench.genetic_algorithm"),
+    ("gabench.islands", "import gabench.islands"),
+    ("generate_results", "import generate_results"),
+    ("sweep", "import sweep"),
+    ("app", "import app"),
+    ("app + matplotlib.pyplot", "import app, matplotlib.pyplot"),
+]
+HEAVY_MODULES = ["tkinter", "matplotlib", "multiprocessing"]
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_times(statement):
+    """
+    Runs the statement in a fresh interpreter with -X importtime.
+
+    Returns:
+        dict: Maps each imported module to its own import time in microseconds.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, cwd=PROJECT_ROOT, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            self_us, _, name = line[len("import time:"):].split("|")
+            if self_us.strip().isdigit():
+                times[name.strip()] = int(self_us)
+    return times
+
+def measure(statement, startup_modules, repeats):
+    """
+    Returns the median time (in ms) spent importing modules that interpreter
+    startup does not already import, and the set of modules imported.
+    """
+    totals = []
+    for _ in range(repeats):
+        times = import_times(statement)
+        totals.append(sum(t for name, t in times.items() if name not in startup_modules) / 1000)
+    return statistics.median(totals), set(times)
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time of the gabench core and the entry points.")
+    parser.add_argument("--repeats", type=int, default=7, help="Fresh interpreters per import (the median is shown).")
+    args = parser.parse_args()
+
+    startup_modules = set(import_times("pass"))
+    print(f"Median import time over {args.repeats} fresh interpreters (startup excluded)")
+    print("| Import                     | Time (ms) | " + " | ".join(f"{m:<15}" for m in HEAVY_MODULES) + " |")
+    print("|----------------------------|-----------|" + "|".join("-" * 17 for _ in HEAVY_MODULES) + "|")
+    for label, statement in IMPORTS:
+        milliseconds, modules = measure(statement, startup_modules, args.repeats)
+        loaded = ["yes" if m in modules else "no" for m in HEAVY_MODULES]
+        print(f"| {label:<26} | {milliseconds:<9.1f} | " + " | ".join(f"{x:<15}" for x in loaded) + " |")
+
+if __name__ == "__main__":
+    main()
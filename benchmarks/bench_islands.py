@@ -0,0 +1,73 @@
+# Benchmark of the island model against a single panmictic population of the
+# same total size, on the multimodal benchmark functions. Reports the mean
+# final fitness over several seeds and the wall-clock time of the island
+# model run in-process and with one process per island.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_islands
+
+import argparse
+import time
+
+import numpy as np
+
+from gabench.benchmark_functions import FUNCTIONS
+from gabench.genetic_algorithm import GeneticAlgorithm
+from gabench.islands import IslandModel
+
+def run_panmictic(info, dimension, pop_size, generations, seed):
+    ga = GeneticAlgorithm(info["func"], info["bounds"], dimension, pop_size=pop_size, seed=seed)
+    for _ in range(generations):
+        ga.run_generation()
+    return ga.best_fitness
+
+def run_islands(info, dimension, args, seed, processes):
+    with IslandModel(info["func"], info["bounds"], dimension, n_islands=args.islands,
+                     pop_size=args.pop_size // args.islands, topology=args.topology,
+                     migration_interval=args.interval, n_migrants=args.migrants,
+                     seed=seed, processes=processes) as model:
+        _, best_fitness = model.run(args.generations)
+    return best_fitness
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Island model vs panmictic GA benchmark.")
+    parser.add_argument("--functions", nargs="+", default=["Rastrigin", "Schwefel", "Ackley", "Griewangk"])
+    parser.add_argument("--dimension", type=int, default=10)
+    parser.add_argument("--pop-size", type=int, default=1000, help="Total population (split across islands).")
+    parser.add_argument("--generations", type=int, default=500)
+    parser.add_argument("--islands", type=int, default=4)
+    parser.add_argument("--topology", default="ring")
+    parser.add_argument("--interval", type=int, default=25)
+    parser.add_argument("--migrants", type=int, default=5)
+    parser.add_argument("--seeds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Island benchmark: {args.islands} islands x {args.pop_size // args.islands} vs 1 x {args.pop_size}, "
+          f"{args.dimension}D, {args.generations} generations, {args.seeds} seeds")
+    print("| Function   | Panmictic mean | Islands mean   | Panmictic s | Islands s (serial) | Islands s (processes) |")
+    print("|------------|----------------|----------------|-------------|--------------------|-----------------------|")
+    for func_name in args.functions:
+        info = FUNCTIONS[func_name]
+        panmictic, islands = [], []
+        t_panmictic = t_serial = t_processes = 0.0
+        for seed in range(args.seeds):
+            result, elapsed = timed(run_panmictic, info, args.dimension, args.pop_size, args.generations, seed)
+            panmictic.append(result)
+            t_panmictic += elapsed
+            result, elapsed = timed(run_islands, info, args.dimension, args, seed, False)
+            t_serial += elapsed
+            result_processes, elapsed = timed(run_islands, info, args.dimension, args, seed, True)
+            t_processes += elapsed
+            assert result == result_processes, "in-process and multi-process islands should match"
+            islands.append(result)
+        n = args.seeds
+        print(f"| {func_name:<10} | {np.mean(panmictic):<14.6f} | {np.mean(islands):<14.6f} | "
+              f"{t_panmictic / n:<11.3f} | {t_serial / n:<18.3f} | {t_processes / n:<21.3f} |")
+
+if __name__ == "__main__":
+    main()
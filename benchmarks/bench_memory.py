@@ -0,0 +1,59 @@
+# Peak memory of one GA generation over a grid of population sizes and
+# dimensions, for float64 and float32 populations. Memory is traced with
+# tracemalloc (NumPy reports its allocations to it) after a warm-up
+# generation, so the reused buffers are already allocated and only the
+# per-generation temporaries count. The population itself is reported
+# alongside, to show how many population-sized arrays a generation needs.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_memory
+
+import argparse
+import time
+import tracemalloc
+
+from gabench.benchmark_functions import FUNCTIONS
+from gabench.genetic_algorithm import GeneticAlgorithm
+
+POP_SIZES = [100, 1_000, 10_000]
+DIMENSIONS = [100, 1_000, 10_000]
+DTYPES = ["float64", "float32"]
+
+def measure(info, pop_size, dimension, dtype, seed):
+    """Returns (population MB, peak MB allocated by one generation, seconds per generation)."""
+    ga = GeneticAlgorithm(info["func"], info["bounds"], dimension, pop_size=pop_size, seed=seed, dtype=dtype)
+    ga.run_generation()
+    tracemalloc.start()
+    start = time.perf_counter()
+    ga.run_generation()
+    elapsed = time.perf_counter() - start
+    # Only allocations made after tracemalloc.start count, i.e. this generation's
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return ga.population.nbytes / 2**20, peak / 2**20, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Peak memory per generation for pop x dim grids.")
+    parser.add_argument("--function", default="Rastrigin", choices=FUNCTIONS.keys())
+    parser.add_argument("--pop-sizes", nargs="+", type=int, default=POP_SIZES)
+    parser.add_argument("--dimensions", nargs="+", type=int, default=DIMENSIONS)
+    parser.add_argument("--max-cells", type=int, default=10_000_000,
+                        help="Skip configurations whose population has more genes than this.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    info = FUNCTIONS[args.function]
+    print(f"Peak memory of one generation ({args.function}), traced after a warm-up generation")
+    print("| Pop      | Dim    | Dtype   | Population MB | Peak MB      | Peak / Pop | Sec/gen  |")
+    print("|----------|--------|---------|---------------|--------------|------------|----------|")
+    for pop_size in args.pop_sizes:
+        for dimension in args.dimensions:
+            if pop_size * dimension > args.max_cells:
+                continue
+            for dtype in DTYPES:
+                population_mb, peak_mb, elapsed = measure(info, pop_size, dimension, dtype, args.seed)
+                print(f"| {pop_size:<8} | {dimension:<6} | {dtype:<7} | {population_mb:<13.1f} | {peak_mb:<12.1f} | "
+                      f"{peak_mb / population_mb:<10.2f} | {elapsed:<8.3f} |")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Benchmark of generations/sec for the vectorized selection, crossover and
+# mutation operators against the original per-individual Python loops.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_operators
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from gabench.benchmark_functions import FUNCTIONS
+from gabench.genetic_algorithm import GeneticAlgorithm
+
+POP_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DIMENSION = 10
+
+class LoopGeneticAlgorithm(GeneticAlgorithm):
+    """The original loop-based operators, kept here as the 'before' baseline."""
+
+    def _selection(self, fitness):
+        parents = []
+        for _ in range(self.pop_size):
+            i, j = np.random.randint(0, self.pop_size, 2)
+            if fitness[i] < fitness[j]:
+                parents.append(self.population[i])
+            else:
+                parents.append(self.population[j])
+        return np.array(parents)
+
+    def _crossover(self, parents):
+        offspring = np.empty_like(parents)
+        for i in range(0, self.pop_size, 2):
+            p1, p2 = parents[i], parents[i+1]
+            if random.random() < self.crossover_rate:
+                crossover_point = random.randint(1, self.dimension - 1)
+                offspring[i] = np.concatenate([p1[:crossover_point], p2[crossover_point:]])
+                offspring[i+1] = np.concatenate([p2[:crossover_point], p1[crossover_point:]])
+            else:
+                offspring[i], offspring[i+1] = p1, p2
+        return offspring
+
+    def _mutation(self, offspring):
+        for i in range(len(offspring)):
+            for j in range(self.dimension):
+                if random.random() < self.mutation_rate:
+                    offspring[i][j] += np.random.normal(0, 0.1)
+                    offspring[i][j] = np.clip(offspring[i][j], self.bounds[0], self.bounds[1])
+        return offspring
+
+def generations_per_second(ga_class, pop_size, dimension, generations):
+    """Times `generations` calls to run_generation and returns generations/sec."""
+    info = FUNCTIONS["Sphere"]
+    # The loop operators do not track lineage, so neither version carries fitness over
+    ga = ga_class(info["func"], info["bounds"], dimension, pop_size=pop_size, carry_fitness=False)
+    ga.run_generation()  # warm-up
+    start = time.perf_counter()
+    for _ in range(generations):
+        ga.run_generation()
+    return generations / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description="Loop vs vectorized GA operator benchmark.")
+    parser.add_argument("--dimension", type=int, default=DIMENSION)
+    parser.add_argument("--generations", type=int, default=3)
+    parser.add_argument("--loop-max-pop", type=int, default=100_000,
+                        help="Largest population to time with the (slow) loop operators.")
+    args = parser.parse_args()
+
+    print(f"Operator benchmark (Sphere, dimension={args.dimension}, batched evaluation)")
+    print("| Pop       | Loop gen/s  | Vectorized gen/s | Speedup   |")
+    print("|-----------|-------------|------------------|-----------|")
+    for pop_size in POP_SIZES:
+        fast = generations_per_second(GeneticAlgorithm, pop_size, args.dimension, args.generations)
+        if pop_size <= args.loop_max_pop:
+            slow = generations_per_second(LoopGeneticAlgorithm, pop_size, args.dimension, 1)
+            print(f"| {pop_size:<9} | {slow:<11.3f} | {fast:<16.3f} | {fast / slow:<8.1f}x |")
+        else:
+            print(f"| {pop_size:<9} | {'skipped':<11} | {fast:<16.3f} | {'-':<9} |")
+
+if __name__ == "__main__":
+    main()
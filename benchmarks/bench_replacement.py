@@ -0,0 +1,52 @@
+# Benchmark of the replacement schemes: generational (the default), elitism
+# and steady-state. Every scheme gets the same budget of objective
+# evaluations, so the table shows how much progress each one makes per
+# evaluation, which is what counts for expensive objectives.
+#
+# Run from the project root:
+#     python -m benchmarks.bench_replacement
+
+import argparse
+
+import numpy as np
+
+from gabench.benchmark_functions import FUNCTIONS
+from gabench.genetic_algorithm import GeneticAlgorithm
+
+def schemes(pop_size):
+    return {
+        "generational": {},
+        "elitism=2": {"elitism": 2},
+        f"steady_state={pop_size // 10}": {"steady_state": pop_size // 10},
+        f"steady_state={pop_size // 2}": {"steady_state": pop_size // 2},
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Replacement scheme benchmark at a fixed evaluation budget.")
+    parser.add_argument("--functions", nargs="+", default=list(FUNCTIONS.keys()))
+    parser.add_argument("--dimension", type=int, default=10)
+    parser.add_argument("--pop-size", type=int, default=100)
+    parser.add_argument("--evaluations", type=int, default=50_000)
+    parser.add_argument("--seeds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Replacement benchmark: {args.dimension}D, population {args.pop_size}, "
+          f"{args.evaluations} evaluations, mean best fitness over {args.seeds} seeds")
+    names = list(schemes(args.pop_size))
+    print("| Function   | " + " | ".join(f"{name:<17}" for name in names) + " |")
+    print("|------------|" + "|".join("-" * 19 for _ in names) + "|")
+    for func_name in args.functions:
+        info = FUNCTIONS[func_name]
+        cells = []
+        for kwargs in schemes(args.pop_size).values():
+            best = []
+            for seed in range(args.seeds):
+                ga = GeneticAlgorithm(info["func"], info["bounds"], args.dimension, pop_size=args.pop_size,
+                                      seed=seed, max_evaluations=args.evaluations, **kwargs)
+                ga.run()
+                best.append(ga.best_fitness)
+            cells.append(np.mean(best))
+        print(f"| {func_name:<10} | " + " | ".join(f"{cell:<17.6f}" for cell in cells) + " |")
+
+if __name__ == "__main__":
+    main()
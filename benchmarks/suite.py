@@ -0,0 +1,200 @@
+# Benchmark and profiling suite for the GA hot path.
+# Sweeps population size, dimension and benchmark function, and times each
+# stage of a generation (evaluation, selection, crossover, mutation)
+# separately, along with generations/sec, evaluations/sec and peak memory.
+# Results are written as JSON and CSV so that two revisions can be compared:
+#
+#     python -m benchmarks.suite run --output before.json
+#     ... change the code ...
+#     python -m benchmarks.suite run --output after.json
+#     python -m benchmarks.suite compare before.json after.json --threshold 0.1
+#
+# compare exits with status 1 if any metric regressed by more than the
+# threshold, so it can gate a CI job.
+
+import argparse
+import csv
+import json
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+from gabench.benchmark_functions import FUNCTIONS
+from gabench.genetic_algorithm import GeneticAlgorithm
+
+POP_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+DIMENSIONS = [2, 10, 100, 1000]
+STAGES = ["evaluate", "selection", "crossover", "mutation"]
+STAGE_METHODS = {
+    "evaluate": "_evaluate_fitness",
+    "selection": "_selection",
+    "crossover": "_crossover",
+    "mutation": "_mutation",
+}
+# Metrics compared between runs, and whether higher values are better
+METRICS = {
+    "generations_per_sec": True,
+    "evaluations_per_sec": True,
+    "evaluate_sec": False,
+    "selection_sec": False,
+    "crossover_sec": False,
+    "mutation_sec": False,
+    "peak_memory_mb": False,
+}
+
+def instrument(ga, stage_times):
+    """
+    Wraps the GA's stage methods on the instance so that each call adds its
+    duration to stage_times[stage]. run_generation picks up the wrappers, so
+    the generation itself runs unmodified.
+    """
+    for stage, method_name in STAGE_METHODS.items():
+        method = getattr(ga, method_name)
+
+        def timed(*args, _method=method, _stage=stage):
+            start = time.perf_counter()
+            result = _method(*args)
+            stage_times[_stage] += time.perf_counter() - start
+            return result
+
+        setattr(ga, method_name, timed)
+
+def benchmark_config(func_name, pop_size, dimension, min_time, max_generations, seed):
+    """Benchmarks one (function, pop_size, dimension) configuration."""
+    info = FUNCTIONS[func_name]
+
+    # Peak memory of one generation (tracing slows things down, so it gets its own pass)
+    tracemalloc.start()
+    ga = GeneticAlgorithm(info["func"], info["bounds"], dimension, pop_size=pop_size, seed=seed)
+    tracemalloc.reset_peak()
+    ga.run_generation()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # Timing pass, after one warm-up generation
+    ga = GeneticAlgorithm(info["func"], info["bounds"], dimension, pop_size=pop_size, seed=seed)
+    ga.run_generation()
+    stage_times = dict.fromkeys(STAGES, 0.0)
+    instrument(ga, stage_times)
+    evaluations_before = ga.evaluations
+    generations = 0
+    start = time.perf_counter()
+    while generations < max_generations:
+        ga.run_generation()
+        generations += 1
+        if time.perf_counter() - start >= min_time:
+            break
+    elapsed = time.perf_counter() - start
+
+    record = {
+        "function": func_name,
+        "pop_size": pop_size,
+        "dimension": dimension,
+        "generations": generations,
+        "generations_per_sec": generations / elapsed,
+        "evaluations_per_sec": (ga.evaluations - evaluations_before) / elapsed,
+        "peak_memory_mb": peak_memory / 2**20,
+    }
+    for stage in STAGES:
+        record[f"{stage}_sec"] = stage_times[stage] / generations
+    return record
+
+def run(args):
+    functions = args.functions or list(FUNCTIONS.keys())
+    records = []
+    for func_name in functions:
+        for pop_size in args.pop_sizes:
+            for dimension in args.dimensions:
+                if pop_size * dimension > args.max_cells:
+                    print(f"  skipping {func_name} pop={pop_size} dim={dimension} (larger than --max-cells)")
+                    continue
+                record = benchmark_config(func_name, pop_size, dimension, args.min_time, args.max_generations, args.seed)
+                records.append(record)
+                print(f"  {func_name:<10} pop={pop_size:<8} dim={dimension:<5} "
+                      f"{record['generations_per_sec']:10.2f} gen/s {record['evaluations_per_sec']:14.0f} evals/s "
+                      f"{record['peak_memory_mb']:9.1f} MB  "
+                      + " ".join(f"{stage}={record[f'{stage}_sec'] * 1000:.3f}ms" for stage in STAGES))
+
+    metadata = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with open(args.output, "w") as f:
+        json.dump({"metadata": metadata, "results": records}, f, indent=2)
+    csv_path = args.output.rsplit(".", 1)[0] + ".csv"
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(records[0].keys()) if records else ["function"])
+        writer.writeheader()
+        writer.writerows(records)
+    print(f"Wrote {len(records)} results to {args.output} and {csv_path}")
+
+def compare(args):
+    """Compares two result files and reports metrics that regressed past the threshold."""
+    def load(path):
+        with open(path) as f:
+            results = json.load(f)["results"]
+        return {(r["function"], r["pop_size"], r["dimension"]): r for r in results}
+
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    regressions = 0
+    print("| Function   | Pop      | Dim   | Metric               | Baseline     | Candidate    | Change   |")
+    print("|------------|----------|-------|----------------------|--------------|--------------|----------|")
+    for key in sorted(baseline.keys() & candidate.keys()):
+        for metric, higher_is_better in METRICS.items():
+            old, new = baseline[key][metric], candidate[key][metric]
+            if old == 0:
+                continue
+            change = (new - old) / old
+            # A positive 'worse' means the candidate got worse by that fraction
+            worse = -change if higher_is_better else change
+            flag = ""
+            if worse > args.threshold:
+                flag = " REGRESSION"
+                regressions += 1
+            elif not args.all:
+                continue
+            func_name, pop_size, dimension = key
+            print(f"| {func_name:<10} | {pop_size:<8} | {dimension:<5} | {metric:<20} | {old:<12.6g} | {new:<12.6g} | {change:+7.1%} |{flag}")
+    missing = baseline.keys() ^ candidate.keys()
+    if missing:
+        print(f"{len(missing)} configurations are only in one of the files and were not compared.")
+    print(f"{regressions} regression(s) past the {args.threshold:.0%} threshold.")
+    return 1 if regressions else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="GA hot path benchmark suite.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark sweep.")
+    run_parser.add_argument("--functions", nargs="+", choices=FUNCTIONS.keys())
+    run_parser.add_argument("--pop-sizes", nargs="+", type=int, default=POP_SIZES)
+    run_parser.add_argument("--dimensions", nargs="+", type=int, default=DIMENSIONS)
+    run_parser.add_argument("--max-cells", type=int, default=20_000_000,
+                            help="Skip configurations whose population has more genes than this.")
+    run_parser.add_argument("--min-time", type=float, default=0.5,
+                            help="Minimum seconds to time each configuration for.")
+    run_parser.add_argument("--max-generations", type=int, default=100)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--output", default="bench_results.json",
+                            help="JSON output path; a CSV is written next to it.")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="Relative slowdown that counts as a regression (0.1 = 10%%).")
+    compare_parser.add_argument("--all", action="store_true", help="Show every metric, not only regressions.")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        raise SystemExit(compare(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# This package is the engine and benchmark core of the project: the genetic
+# algorithm, the benchmark functions, and everything around them (evaluators,
+# checkpoints, history, metrics, adaptive operators, multi-run and island
+# models). It depends only on NumPy; the Tkinter GUI (app.py) and the
+# matplotlib plots live outside it.
+#
+# The names below are loaded on first access, so `import gabench` stays cheap
+# and e.g. the island model's multiprocessing import is only paid when used:
+#
+#     from gabench import GeneticAlgorithm, FUNCTIONS
+
+import importlib
+
+# Public name -> the submodule that defines it
+_EXPORTS = {
+    "FUNCTIONS": "benchmark_functions",
+    "ShekelFunction": "benchmark_functions",
+    "GeneticAlgorithm": "genetic_algorithm",
+    "TARGET_TOLERANCE": "genetic_algorithm",
+    "MultiRunGA": "multi_run",
+    "IslandModel": "islands",
+    "HistoryRecorder": "history",
+    "FitnessCache": "fitness_cache",
+    "SerialEvaluator": "evaluators",
+    "ThreadPoolEvaluator": "evaluators",
+    "ProcessPoolEvaluator": "evaluators",
+    "ScaledStep": "adaptation",
+    "OneFifthRule": "adaptation",
+    "SelfAdaptiveStep": "adaptation",
+    "SuccessRateAdaptation": "adaptation",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,206 @@
+# This file defines the adaptive strategies GeneticAlgorithm can use instead of
+# its fixed operator settings. Step-size strategies set the standard deviation
+# of the Gaussian mutation noise (passed as mutation_step); by default it is a
+# fixed 0.1, whatever the function's bounds. SuccessRateAdaptation (passed as
+# rate_adaptation) tunes crossover_rate and mutation_rate during the run.
+#
+# Strategies only hold their settings. The values they adapt live on the GA
+# (ga.step_size, ga.crossover_rate, ga.mutation_rate), so one strategy object
+# can be shared between GAs (e.g. islands) and the adapted values are saved in
+# checkpoints. Everything is vectorized over the population, and per run for
+# a MultiRunGA, whose runs each adapt their own values.
+#
+# Strategies that learn from results get the outcome of every offspring of the
+# previous generation once it has been evaluated: whether it improved on its
+# parent, and whether crossover and mutation were applied to it. An offspring
+# "improved" if its fitness is lower than that of the parent it was selected
+# as (the parent whose genes it starts with).
+
+import numpy as np
+
+class ScaledStep:
+    """
+    A fixed mutation step size, scaled to the width of the bounds: a step of
+    0.01 is 0.1 on Rastrigin (±5.12) and 10 on Schwefel (±500).
+    """
+    # Whether each individual carries its own step sizes (see SelfAdaptiveStep)
+    self_adaptive = False
+    # Whether update() learns from the outcome of the offspring
+    learns = False
+
+    def __init__(self, fraction=0.01):
+        """
+        Args:
+            fraction (float): The step size as a fraction of max_b - min_b.
+        """
+        self.fraction = fraction
+
+    def config(self):
+        """The constructor arguments, as saved in checkpoints (see strategy_from_config)."""
+        return {"fraction": self.fraction}
+
+    def initial_step_size(self, ga):
+        """
+        Returns the initial step size array, shaped to broadcast against the
+        (..., n_offspring, dimension) offspring: one value per run here.
+        """
+        min_b, max_b = ga.bounds
+        return np.full(ga._batch_shape[:-1] + (1, 1), self.fraction * (max_b - min_b))
+
+    def update(self, ga, improved, crossed, mutated):
+        """
+        Adapts ga.step_size from the outcome of the last offspring. Each
+        argument is a boolean array with the population's batch shape.
+        """
+
+class OneFifthRule(ScaledStep):
+    """
+    Rechenberg's 1/5th success rule: after each generation the step size grows
+    if more than a fifth of the mutated offspring improved on their parent, and
+    shrinks if fewer did. Only offspring made by mutation alone count, since
+    crossover would mask the effect of the step. Too small a step improves
+    often but slowly, too large a step rarely improves, so the rule keeps the
+    step near the scale of the landscape around the population.
+    The 1/5th target assumes every gene is mutated. When an offspring only
+    mutates a few genes (mutation_rate times the dimension is small), success
+    comes more easily and a higher target, around 0.3 to 0.4, works better.
+    """
+    learns = True
+
+    def __init__(self, fraction=0.1, factor=0.85, target=0.2, min_fraction=1e-8):
+        """
+        Args:
+            fraction (float): The initial step size as a fraction of the width
+                of the bounds.
+            factor (float): The step is multiplied by factor (< 1) when too few
+                mutations succeed, and divided by it when too many do.
+            target (float): The success rate the rule aims for.
+            min_fraction (float): Lower limit of the step, as a fraction of the
+                width of the bounds. The upper limit is the width itself.
+        """
+        super().__init__(fraction)
+        self.factor = factor
+        self.target = target
+        self.min_fraction = min_fraction
+
+    def config(self):
+        return {"fraction": self.fraction, "factor": self.factor, "target": self.target,
+                "min_fraction": self.min_fraction}
+
+    def update(self, ga, improved, crossed, mutated):
+        mutated = mutated & ~crossed
+        trials = np.count_nonzero(mutated, axis=-1)
+        success_rate = np.count_nonzero(improved & mutated, axis=-1) / np.maximum(trials, 1)
+        # Runs without a mutated offspring keep their step
+        factor = np.where(success_rate > self.target, 1 / self.factor, self.factor)
+        factor = np.where((trials == 0) | (success_rate == self.target), 1.0, factor)
+        ga.step_size *= factor[..., None, None]
+        min_b, max_b = ga.bounds
+        np.clip(ga.step_size, self.min_fraction * (max_b - min_b), max_b - min_b, out=ga.step_size)
+
+class SelfAdaptiveStep(ScaledStep):
+    """
+    Self-adaptive step sizes, as in evolution strategies: every individual
+    carries its own step size (or one per gene), stored as extra columns of
+    its genome in ga.step_size. They are selected, crossed over (as columns
+    after the last gene, so they are swapped whenever a pair crosses over) and
+    replaced along with the genes. Before an offspring's genes are mutated its
+    step sizes are multiplied by a log-normal factor, so individuals whose
+    step size suits the landscape produce better offspring and pass it on.
+    """
+    self_adaptive = True
+
+    def __init__(self, fraction=0.1, per_gene=False, min_fraction=1e-8):
+        """
+        Args:
+            fraction (float): The initial step size as a fraction of the width
+                of the bounds.
+            per_gene (bool): Carry one step size per gene instead of one per
+                individual. This adds as many columns as there are genes.
+            min_fraction (float): Lower limit of the steps, as a fraction of
+                the width of the bounds. The upper limit is the width itself.
+        """
+        super().__init__(fraction)
+        self.per_gene = per_gene
+        self.min_fraction = min_fraction
+
+    def config(self):
+        return {"fraction": self.fraction, "per_gene": self.per_gene, "min_fraction": self.min_fraction}
+
+    def initial_step_size(self, ga):
+        """Returns the (..., pop_size, columns) step sizes of the initial population."""
+        min_b, max_b = ga.bounds
+        columns = ga.dimension if self.per_gene else 1
+        return np.full(ga._batch_shape + (columns,), self.fraction * (max_b - min_b))
+
+    def mutate(self, ga, step_size):
+        """
+        Mutates the (..., n_offspring, columns) step sizes of the offspring in
+        place, with the standard learning rates for the problem's dimension.
+        """
+        n = ga.dimension
+        if self.per_gene:
+            noise = ga.rng.standard_normal(step_size.shape[:-1] + (1,)) / np.sqrt(2 * n)
+            noise = noise + ga.rng.standard_normal(step_size.shape) / np.sqrt(2 * np.sqrt(n))
+        else:
+            noise = ga.rng.standard_normal(step_size.shape) / np.sqrt(n)
+        step_size *= np.exp(noise)
+        min_b, max_b = ga.bounds
+        np.clip(step_size, self.min_fraction * (max_b - min_b), max_b - min_b, out=step_size)
+
+class SuccessRateAdaptation:
+    """
+    Adapts crossover_rate and mutation_rate from how often each operator
+    produces offspring that improve on their parent. Among the offspring that
+    changed, those made with crossover are compared with those made by
+    mutation alone; when crossover succeeds more often its rate is multiplied
+    by factor, and divided by it otherwise. mutation_rate is adapted the same
+    way, comparing mutated offspring with those made by crossover alone.
+    """
+    learns = True
+
+    def __init__(self, factor=1.1, min_rate=0.01, max_rate=1.0):
+        """
+        Args:
+            factor (float): How much (> 1) a rate changes per generation.
+            min_rate (float): Lower limit of both rates.
+            max_rate (float): Upper limit of both rates.
+        """
+        self.factor = factor
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+
+    def config(self):
+        return {"factor": self.factor, "min_rate": self.min_rate, "max_rate": self.max_rate}
+
+    def _adjust(self, rate, improved, applied, not_applied):
+        """Scales the rate (one value per run) by comparing the two groups' success rates."""
+        n_applied = np.count_nonzero(applied, axis=-1)
+        n_not_applied = np.count_nonzero(not_applied, axis=-1)
+        success_applied = np.count_nonzero(improved & applied, axis=-1) / np.maximum(n_applied, 1)
+        success_not_applied = np.count_nonzero(improved & not_applied, axis=-1) / np.maximum(n_not_applied, 1)
+        factor = np.where(success_applied > success_not_applied, self.factor, 1 / self.factor)
+        # Rates stay put while either group is empty or both do equally well
+        factor = np.where((n_applied == 0) | (n_not_applied == 0) | (success_applied == success_not_applied),
+                          1.0, factor)
+        return np.clip(rate * factor, self.min_rate, self.max_rate)
+
+    def update(self, ga, improved, crossed, mutated):
+        """Adapts ga.crossover_rate and ga.mutation_rate (see ScaledStep.update)."""
+        ga.crossover_rate = self._adjust(ga.crossover_rate, improved, crossed, mutated & ~crossed)
+        ga.mutation_rate = self._adjust(ga.mutation_rate, improved, mutated, crossed & ~mutated)
+
+# Strategy classes by name, for strategy_from_config
+STRATEGIES = {cls.__name__: cls for cls in (ScaledStep, OneFifthRule, SelfAdaptiveStep, SuccessRateAdaptation)}
+
+def strategy_config(strategy):
+    """Describes a strategy as a JSON-compatible dict, e.g. {"name": "OneFifthRule", "factor": 0.85, ...}."""
+    return {"name": type(strategy).__name__, **strategy.config()}
+
+def strategy_from_config(config):
+    """Creates a strategy from a dict as returned by strategy_config (only "name" is required)."""
+    config = dict(config)
+    name = config.pop("name")
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {name!r}, expected one of {list(STRATEGIES)}")
+    return STRATEGIES[name](**config)
@@ -0,0 +1,224 @@
+# This file contains the implementation of the 7 benchmark functions.
+# Each function takes a list or numpy array 'x' as input, representing a point
+# in the search space, and returns a single floating-point value, which is
+# the fitness or objective value to be minimized.
+#
+# Every function also has a batched variant (e.g. ackley_batch) that takes a
+# population matrix of shape (pop_size, dimension) and returns a (pop_size,)
+# vector of fitness values in one vectorized call. The batched variant is
+# attached to the scalar function as its `batch` attribute, which is how the
+# GeneticAlgorithm discovers it. Shekel is a ShekelFunction object instead,
+# so that its parameter table is configurable; its batch is a method.
+
+import functools
+
+import numpy as np
+
+# 1. Ackley Function
+def ackley(x):
+    """
+    Ackley function. A complex multimodal function with many local minima.
+    The global minimum is at f(0, 0, ..., 0) = 0.
+    """
+    n = len(x)
+    sum1 = np.sum(np.square(x))
+    sum2 = np.sum(np.cos(2 * np.pi * x))
+    term1 = -20 * np.exp(-0.2 * np.sqrt(sum1 / n))
+    term2 = -np.exp(sum2 / n)
+    return term1 + term2 + 20 + np.e
+
+# 2. Rosenbrock Function
+def rosenbrock(x):
+    """
+    Rosenbrock function. A non-convex function with a narrow, parabolic-shaped
+    global minimum valley.
+    The global minimum is at f(1, 1, ..., 1) = 0.
+    """
+    return np.sum(100 * (x[1:] - x[:-1]**2)**2 + (1 - x[:-1])**2)
+
+# 3. Rastrigin Function
+def rastrigin(x):
+    """
+    Rastrigin function. A highly multimodal function with a regular pattern
+    of local minima.
+    The global minimum is at f(0, 0, ..., 0) = 0.
+    """
+    n = len(x)
+    return 10 * n + np.sum(x**2 - 10 * np.cos(2 * np.pi * x))
+
+# 4. Shekel Function
+# C and A are predefined matrices for the Shekel function
+SHEKEL_C = np.array([4, 1, 8, 6, 3, 2, 5, 8, 6, 7])
+SHEKEL_A = np.array([
+    [4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    [8, 8, 8, 8, 8, 8, 8, 8, 8, 8],
+    [6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
+    [3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
+    [2, 2, 2, 2, 2, 2, 2, 2, 2, 2],
+    [5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
+    [8, 8, 8, 8, 8, 8, 8, 8, 8, 8],
+    [6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
+    [7, 7, 7, 7, 7, 7, 7, 7, 7, 7]
+])
+
+# The standard 4-dimensional Shekel parameters (Shekel 5, 7 and 10 use the
+# first 5, 7 or 10 rows). Their minima are about -10.1532, -10.4029 and
+# -10.5364, near (4, 4, 4, 4).
+STANDARD_SHEKEL_C = 0.1 * np.array([1, 2, 2, 4, 4, 6, 3, 7, 5, 5])
+STANDARD_SHEKEL_A = np.array([
+    [4, 4, 4, 4],
+    [1, 1, 1, 1],
+    [8, 8, 8, 8],
+    [6, 6, 6, 6],
+    [3, 7, 3, 7],
+    [2, 9, 2, 9],
+    [5, 5, 3, 3],
+    [8, 1, 8, 1],
+    [6, 2, 6, 2],
+    [7, 3.6, 7, 3.6]
+])
+
+class ShekelFunction:
+    """
+    Shekel function. A multimodal function with several local minima, one
+    per row of the parameter table A (with the widths in C):
+        f(x) = -sum_i 1 / (|x - A_i|^2 + C_i)
+    Called like the other functions, with a `batch` method for populations.
+    For more dimensions than A has columns, the columns are repeated
+    cyclically. The table for each dimension is built once and cached.
+    """
+    def __init__(self, A, C):
+        """
+        Args:
+            A (array): The (m, k) table of minima locations.
+            C (array): The m widths.
+        """
+        self.A = np.asarray(A, dtype=float)
+        self.C = np.asarray(C, dtype=float)
+        self._tables = {}
+
+    def _table(self, dimension):
+        """Returns A with its columns tiled to the given dimension."""
+        table = self._tables.get(dimension)
+        if table is None:
+            table = self._tables[dimension] = self.A[:, np.arange(dimension) % self.A.shape[1]]
+        return table
+
+    def __call__(self, x):
+        return self.batch(np.asarray(x))
+
+    def batch(self, X):
+        """
+        Batched Shekel function. The squared distances from every individual
+        to every row of A come from one broadcasted (..., m, dimension)
+        difference; the m terms are then summed.
+        """
+        differences = X[..., None, :] - self._table(X.shape[-1])
+        squared_distances = np.einsum('...k,...k->...', differences, differences)
+        return -np.sum(1 / (squared_distances + self.C), axis=-1)
+
+shekel = ShekelFunction(SHEKEL_A, SHEKEL_C)
+shekel5 = ShekelFunction(STANDARD_SHEKEL_A[:5], STANDARD_SHEKEL_C[:5])
+shekel7 = ShekelFunction(STANDARD_SHEKEL_A[:7], STANDARD_SHEKEL_C[:7])
+shekel10 = ShekelFunction(STANDARD_SHEKEL_A, STANDARD_SHEKEL_C)
+
+# 5. Sphere Function
+def sphere(x):
+    """
+    Sphere function. A simple, convex, and unimodal function.
+    The global minimum is at f(0, 0, ..., 0) = 0.
+    """
+    return np.sum(np.square(x))
+
+# 6. Schwefel Function
+# The maximum of x * sin(sqrt(|x|)) over the bounds, at x = 420.9687...,
+# to full precision: the usual rounded 418.9829 leaves the minimum at about
+# 1.27e-5 per dimension instead of 0, out of reach of a target of 0.
+SCHWEFEL_CONSTANT = 418.9828872724338
+
+def schwefel(x):
+    """
+    Schwefel function. A complex multimodal function where the global minimum
+    is far from the best local minima.
+    The global minimum is near f(420.9687, ..., 420.9687).
+    """
+    n = len(x)
+    return SCHWEFEL_CONSTANT * n - np.sum(x * np.sin(np.sqrt(np.abs(x))))
+
+# 7. Griewangk Function
+@functools.lru_cache(maxsize=None)
+def _griewangk_divisors(n):
+    """Returns sqrt(1), ..., sqrt(n), computed once per dimension (read-only)."""
+    divisors = np.sqrt(np.arange(1, n + 1))
+    divisors.flags.writeable = False
+    return divisors
+
+def griewangk(x):
+    """
+    Griewangk function. A multimodal function with a product term that
+    introduces dependencies between the variables.
+    The global minimum is at f(0, 0, ..., 0) = 0.
+    """
+    sum_term = np.sum(x**2 / 4000)
+    prod_term = np.prod(np.cos(x / _griewangk_divisors(len(x))))
+    return sum_term - prod_term + 1
+
+# Batched Variants
+# Each of these takes an array X whose last axis is the dimension (usually a
+# (pop_size, dimension) population matrix) and reduces over that axis only, so
+# row k of the result is exactly the scalar function applied to X[k].
+
+def ackley_batch(X):
+    """Batched Ackley function."""
+    n = X.shape[-1]
+    sum1 = np.sum(np.square(X), axis=-1)
+    sum2 = np.sum(np.cos(2 * np.pi * X), axis=-1)
+    term1 = -20 * np.exp(-0.2 * np.sqrt(sum1 / n))
+    term2 = -np.exp(sum2 / n)
+    return term1 + term2 + 20 + np.e
+
+def rosenbrock_batch(X):
+    """Batched Rosenbrock function."""
+    return np.sum(100 * (X[..., 1:] - X[..., :-1]**2)**2 + (1 - X[..., :-1])**2, axis=-1)
+
+def rastrigin_batch(X):
+    """Batched Rastrigin function."""
+    n = X.shape[-1]
+    return 10 * n + np.sum(X**2 - 10 * np.cos(2 * np.pi * X), axis=-1)
+
+def sphere_batch(X):
+    """Batched Sphere function."""
+    return np.sum(np.square(X), axis=-1)
+
+def schwefel_batch(X):
+    """Batched Schwefel function."""
+    n = X.shape[-1]
+    return SCHWEFEL_CONSTANT * n - np.sum(X * np.sin(np.sqrt(np.abs(X))), axis=-1)
+
+def griewangk_batch(X):
+    """Batched Griewangk function."""
+    sum_term = np.sum(X**2 / 4000, axis=-1)
+    prod_term = np.prod(np.cos(X / _griewangk_divisors(X.shape[-1])), axis=-1)
+    return sum_term - prod_term + 1
+
+ackley.batch = ackley_batch
+rosenbrock.batch = rosenbrock_batch
+rastrigin.batch = rastrigin_batch
+sphere.batch = sphere_batch
+schwefel.batch = schwefel_batch
+griewangk.batch = griewangk_batch
+
+# Dictionary to easily access functions by name and their typical bounds
+# These bounds are important for initializing the population within a reasonable search space.
+# The optimum is the known global minimum value, used as a target for early
+# stopping. It is None for Shekel, whose minimum depends on the dimension.
+FUNCTIONS = {
+    "Ackley": {"func": ackley, "bounds": (-32.768, 32.768), "optimum": 0.0},
+    "Rosenbrock": {"func": rosenbrock, "bounds": (-5, 10), "optimum": 0.0},
+    "Rastrigin": {"func": rastrigin, "bounds": (-5.12, 5.12), "optimum": 0.0},
+    "Shekel": {"func": shekel, "bounds": (0, 10), "optimum": None},
+    "Sphere": {"func": sphere, "bounds": (-5.12, 5.12), "optimum": 0.0},
+    "Schwefel": {"func": schwefel, "bounds": (-500, 500), "optimum": 0.0},
+    "Griewangk": {"func": griewangk, "bounds": (-600, 600), "optimum": 0.0},
+}
\ No newline at end of file
@@ -0,0 +1,85 @@
+# This file handles saving and restoring GeneticAlgorithm state to compact
+# .npz files, and the background Autosaver used for periodic checkpoints.
+# A checkpoint holds everything needed to continue a run exactly where it
+# left off: the population, carried-over fitness, cache contents, random
+# generator state, counters and best-fitness history. The objective function
+# and evaluator are not saved; they are passed in again when loading (see
+# GeneticAlgorithm.load_checkpoint).
+
+import json
+import os
+
+import numpy as np
+
+# Key under which the JSON-encoded non-array part of the state is stored
+_META_KEY = "__meta__"
+
+def _to_json(value):
+    """Converts numpy scalars (the only non-JSON values in a state) to Python ones."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot store {type(value).__name__} in a checkpoint")
+
+def write_checkpoint(state, path, compress=False):
+    """
+    Writes a state dict (from GeneticAlgorithm.state_dict) to an .npz file.
+    Array values are stored as arrays, everything else as one JSON document.
+    The file is written under a temporary name and then renamed, so a crash
+    mid-write never leaves a truncated checkpoint behind.
+    """
+    arrays = {key: value for key, value in state.items() if isinstance(value, np.ndarray)}
+    meta = {key: value for key, value in state.items() if not isinstance(value, np.ndarray)}
+    arrays[_META_KEY] = np.array(json.dumps(meta, default=_to_json))
+
+    temp_path = os.fspath(path) + ".tmp.npz"
+    save = np.savez_compressed if compress else np.savez
+    save(temp_path, **arrays)
+    os.replace(temp_path, path)
+
+def read_checkpoint(path):
+    """Reads a state dict written by write_checkpoint."""
+    with np.load(path, allow_pickle=False) as data:
+        state = json.loads(str(data[_META_KEY]))
+        state.update({key: data[key] for key in data.files if key != _META_KEY})
+    return state
+
+class Autosaver:
+    """
+    Periodically checkpoints a GeneticAlgorithm from a background thread.
+    The state is copied on the GA's thread (cheap), and compressed and written
+    on the saver's thread, so the generation loop only waits if the previous
+    checkpoint is still being written when the next one is due.
+    """
+    def __init__(self, path, every, compress=False):
+        """
+        Args:
+            path (str or os.PathLike): The checkpoint file, overwritten on each save.
+            every (int): Save after every n-th generation.
+            compress (bool): Write a compressed .npz.
+        """
+        self.path = path
+        self.every = every
+        self.compress = compress
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+
+    def after_generation(self, ga):
+        """Called by the GA after each generation; saves when one is due."""
+        if ga.generation % self.every == 0:
+            self.save(ga)
+
+    def save(self, ga):
+        """Starts writing a checkpoint of the GA's current state."""
+        self.wait()
+        self._pending = self._executor.submit(write_checkpoint, ga.state_dict(), self.path, self.compress)
+
+    def wait(self):
+        """Blocks until the checkpoint being written (if any) is on disk."""
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def close(self):
+        self.wait()
+        self._executor.shutdown()
@@ -0,0 +1,179 @@
+# This file defines the fitness evaluator backends used by GeneticAlgorithm.
+# An evaluator takes an objective function and a (pop_size, dimension)
+# population matrix and returns the (pop_size,) fitness vector. The serial
+# evaluator is the default; the thread and process pool evaluators are meant
+# for expensive objectives where a single evaluation takes milliseconds.
+# Pools are created once and reused for every generation until close() is
+# called (or the evaluator is used as a context manager).
+# concurrent.futures and multiprocessing are only imported once a pool
+# evaluator is created, so the serial default adds nothing to import time.
+
+import math
+import os
+
+import numpy as np
+
+# Default size of the population chunks evaluated by SerialEvaluator. The
+# objective's temporaries are a small multiple of this, however large the
+# population is.
+CHUNK_BYTES = 4 * 2**20
+
+def evaluate_rows(objective_func, population):
+    """
+    Evaluates every row of the population in the current thread.
+    Uses the objective's vectorized `batch` variant when it has one, and calls
+    the objective once per row otherwise. Rows stored as float32 are
+    converted to float64 first, so fitness is always computed in double
+    precision.
+    """
+    population = np.asarray(population, dtype=float)
+    batch_func = getattr(objective_func, "batch", None)
+    if batch_func is not None:
+        return np.asarray(batch_func(population), dtype=float)
+    return np.array([objective_func(ind) for ind in population], dtype=float)
+
+def _chunk_bounds(n_rows, chunk_size):
+    """Splits range(n_rows) into consecutive (start, stop) chunks."""
+    return [(start, min(start + chunk_size, n_rows)) for start in range(0, n_rows, chunk_size)]
+
+class SerialEvaluator:
+    """
+    Evaluates the population in-process, one chunk of rows at a time.
+    """
+    def __init__(self, chunk_size=None):
+        """
+        Args:
+            chunk_size (int): Rows per call of the objective. Defaults to as
+                many rows as fit in CHUNK_BYTES of float64 genes, which bounds
+                the temporary memory of high-dimensional evaluations.
+        """
+        self.chunk_size = chunk_size
+
+    def evaluate(self, objective_func, population):
+        """Returns the fitness of each row of the population."""
+        chunk_size = self.chunk_size or max(1, CHUNK_BYTES // (8 * population.shape[-1]))
+        if len(population) <= chunk_size:
+            return evaluate_rows(objective_func, population)
+        fitness = np.empty(len(population))
+        for start, stop in _chunk_bounds(len(population), chunk_size):
+            fitness[start:stop] = evaluate_rows(objective_func, population[start:stop])
+        return fitness
+
+    def close(self):
+        """Releases any resources held by the evaluator."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class ThreadPoolEvaluator(SerialEvaluator):
+    """
+    Evaluates chunks of the population on a persistent thread pool.
+    Only useful for objectives that release the GIL (most NumPy code) or that
+    wait on I/O; pure-Python objectives should use ProcessPoolEvaluator.
+    """
+    def __init__(self, workers=None, chunk_size=None):
+        """
+        Args:
+            workers (int): Number of threads. Defaults to the number of CPUs.
+            chunk_size (int): Rows per task. Defaults to splitting the
+                population into 4 chunks per worker.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+
+    def _chunks(self, n_rows):
+        chunk_size = self.chunk_size or max(1, math.ceil(n_rows / (4 * self.workers)))
+        return _chunk_bounds(n_rows, chunk_size)
+
+    def evaluate(self, objective_func, population):
+        fitness = np.empty(len(population))
+        chunks = self._chunks(len(population))
+        results = self._executor.map(lambda b: evaluate_rows(objective_func, population[b[0]:b[1]]), chunks)
+        for (start, stop), chunk_fitness in zip(chunks, results):
+            fitness[start:stop] = chunk_fitness
+        return fitness
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+# Shared memory block attached in a worker process, reused across generations
+# until the parent replaces it with a new (larger) one.
+_worker_block = None
+
+def _attach_block(name):
+    """Attaches to the parent's shared memory block (once per worker)."""
+    global _worker_block
+    if _worker_block is None or _worker_block.name != name:
+        if _worker_block is not None:
+            _worker_block.close()
+        # Pool workers share the parent's resource tracker, which unlinks the
+        # block once the parent calls unlink() in ProcessPoolEvaluator.close()
+        from multiprocessing import shared_memory
+        _worker_block = shared_memory.SharedMemory(name=name)
+    return _worker_block
+
+def _evaluate_shared_chunk(objective_func, block_name, shape, dtype, start, stop):
+    """Worker task: evaluates rows [start, stop) of the shared population."""
+    block = _attach_block(block_name)
+    population = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    return evaluate_rows(objective_func, population[start:stop])
+
+class ProcessPoolEvaluator(ThreadPoolEvaluator):
+    """
+    Evaluates chunks of the population on a persistent process pool.
+    The population is copied once per generation into a shared memory block
+    that the workers map directly, so only the objective function reference,
+    the row range of each chunk and the resulting fitness values are pickled.
+    The objective must be picklable (e.g. a module-level function).
+    """
+    def __init__(self, workers=None, chunk_size=None, mp_context=None):
+        """
+        Args:
+            workers (int): Number of processes. Defaults to the number of CPUs.
+            chunk_size (int): Rows per task. Defaults to splitting the
+                population into 4 chunks per worker.
+            mp_context: A multiprocessing context (e.g. for the 'spawn' method).
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        from concurrent.futures import ProcessPoolExecutor
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=mp_context)
+        self._block = None
+
+    def _shared_population(self, population):
+        """Copies the population into shared memory, growing the block if needed."""
+        if self._block is None or self._block.size < population.nbytes:
+            self._release_block()
+            from multiprocessing import shared_memory
+            self._block = shared_memory.SharedMemory(create=True, size=max(population.nbytes, 1))
+        shared = np.ndarray(population.shape, dtype=population.dtype, buffer=self._block.buf)
+        shared[...] = population
+        return shared
+
+    def evaluate(self, objective_func, population):
+        shared = self._shared_population(population)
+        fitness = np.empty(len(population))
+        chunks = self._chunks(len(population))
+        futures = [
+            self._executor.submit(_evaluate_shared_chunk, objective_func, self._block.name,
+                                  shared.shape, shared.dtype.str, start, stop)
+            for start, stop in chunks
+        ]
+        for (start, stop), future in zip(chunks, futures):
+            fitness[start:stop] = future.result()
+        return fitness
+
+    def _release_block(self):
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._release_block()
@@ -0,0 +1,81 @@
+# This file defines FitnessCache, a size-bounded LRU cache of fitness values
+# keyed by the raw bytes of each genome. It is meant for expensive objectives,
+# where looking a genome up is much cheaper than evaluating it again.
+
+from collections import OrderedDict
+
+import numpy as np
+
+class FitnessCache:
+    """
+    A least-recently-used cache mapping genomes to their fitness.
+    """
+    def __init__(self, maxsize=100_000):
+        """
+        Args:
+            maxsize (int): The maximum number of genomes kept. When full, the
+                least recently used entry is evicted.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def evaluate(self, evaluate_fn, population):
+        """
+        Returns the fitness of each row of the population, calling
+        evaluate_fn(rows) only for the genomes that are not cached. Duplicate
+        genomes within the population are evaluated once.
+        """
+        fitness = np.empty(len(population))
+        # Maps the key of each missing genome to the rows that share it
+        missing = {}
+        for i, genome in enumerate(population):
+            key = genome.tobytes()
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                fitness[i] = self._entries[key]
+                self.hits += 1
+            elif key in missing:
+                missing[key].append(i)
+                self.hits += 1
+            else:
+                missing[key] = [i]
+                self.misses += 1
+
+        if missing:
+            first_rows = [rows[0] for rows in missing.values()]
+            new_fitness = evaluate_fn(population[first_rows])
+            for (key, rows), value in zip(missing.items(), new_fitness):
+                fitness[rows] = value
+                self._store(key, value)
+        return fitness
+
+    def _store(self, key, value):
+        self._entries[key] = float(value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def to_arrays(self):
+        """
+        Returns the cache contents as (keys, values), in least to most recently
+        used order. keys is a (n, key_bytes) uint8 matrix of the genome bytes.
+        """
+        if not self._entries:
+            return np.empty((0, 0), dtype=np.uint8), np.empty(0)
+        keys = np.frombuffer(b"".join(self._entries.keys()), dtype=np.uint8).reshape(len(self._entries), -1)
+        return keys, np.fromiter(self._entries.values(), dtype=float, count=len(self._entries))
+
+    def load_arrays(self, keys, values):
+        """Replaces the cache contents with arrays returned by to_arrays."""
+        self._entries = OrderedDict((key.tobytes(), float(value)) for key, value in zip(keys, values))
+
+    def clear(self):
+        """Removes every entry and resets the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
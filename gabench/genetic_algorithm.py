@@ -0,0 +1,865 @@
+# This file defines the GeneticAlgorithm class, which encapsulates the core
+# logic for the optimization process. It is designed to be independent of the
+# GUI and the specific benchmark functions, making it reusable.
+
+import math
+import time
+
+import numpy as np
+
+from .adaptation import strategy_config, strategy_from_config
+from .checkpoint import Autosaver, read_checkpoint, write_checkpoint
+from .evaluators import CHUNK_BYTES, SerialEvaluator
+from .fitness_cache import FitnessCache
+
+# How close to target_fitness counts as having reached it, by default
+TARGET_TOLERANCE = 1e-3
+
+def _no_clock():
+    """Stands in for time.perf_counter when nobody is observing the GA."""
+    return 0.0
+
+def spawn_rngs(seed, n_streams):
+    """
+    Creates independent random number generators from a single master seed.
+    Uses numpy's SeedSequence spawning, so the streams are statistically
+    independent and can safely be handed to parallel runs, workers or islands.
+    Args:
+        seed (int, SeedSequence or None): The master seed.
+        n_streams (int): The number of child streams to create.
+    Returns:
+        list: A list of n_streams np.random.Generator objects.
+    """
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in seed_seq.spawn(n_streams)]
+
+class GeneticAlgorithm:
+    """
+    A class to encapsulate the Genetic Algorithm logic.
+    """
+    def __init__(self, objective_func, bounds, dimension, pop_size=1000, crossover_rate=0.8, mutation_rate=0.2,
+                 seed=None, rng=None, evaluator=None, carry_fitness=True, cache_size=0,
+                 elitism=0, steady_state=None, dtype=np.float64, mutation_step=0.1, rate_adaptation=None,
+                 max_generations=None, target_fitness=None, target_tolerance=TARGET_TOLERANCE, patience=None,
+                 min_diversity=None, max_time=None, max_evaluations=None,
+                 autosave_path=None, autosave_every=100, record_history=False):
+        """
+        Initializes the Genetic Algorithm optimizer.
+        Args:
+            objective_func (function): The function to be minimized. If it has a
+                `batch` attribute, that is used to evaluate the whole population in
+                one call (see evaluators.evaluate_rows).
+            bounds (tuple): A tuple (min_val, max_val) for the search space.
+            dimension (int): The number of dimensions for the problem.
+            pop_size (int): The size of the population.
+            crossover_rate (floa`t): The probability of crossover.
+            mutation_rate (float): The probability of mutation for each gene.
+            seed (int): Seed for the random number generator, for reproducible runs.
+            rng (np.random.Generator): A generator to draw from instead (e.g. one
+                from spawn_rngs). Takes precedence over seed.
+            evaluator: The fitness evaluation backend (see evaluators.py). Defaults
+                to a SerialEvaluator. The caller owns it and should close() it.
+            carry_fitness (bool): Reuse the parent's fitness for offspring that are
+                unchanged copies of it (no crossover and no mutated gene) instead
+                of evaluating them again. Assumes a deterministic objective.
+            cache_size (int): If positive, keep an LRU cache of this many genome
+                fitness values (see fitness_cache.py). Worth it for expensive
+                objectives only.
+            dtype: The population's float type. np.float32 halves the memory of
+                high-dimensional populations; fitness is still computed in
+                float64 (see evaluators.evaluate_rows).
+
+        Adaptation (see adaptation.py):
+            mutation_step: The standard deviation of the Gaussian mutation
+                noise. A float is a fixed step; a step-size strategy (ScaledStep,
+                OneFifthRule or SelfAdaptiveStep) adapts it to the bounds or
+                during the run. The current step is in step_size.
+            rate_adaptation: A SuccessRateAdaptation that adapts crossover_rate
+                and mutation_rate during the run. They then hold one value per
+                run, as numpy arrays.
+            Strategies may also be given as dicts as returned by
+            adaptation.strategy_config, e.g. {"name": "OneFifthRule"}.
+
+        Replacement (generational by default, the whole population is replaced):
+            elitism (int): Copy this many of the best individuals unchanged into
+                the next generation. Their fitness is carried over like that of
+                any unchanged offspring (see carry_fitness).
+            steady_state (int): If set, each generation creates only this many
+                offspring, which overwrite the worst individuals in place. Only
+                the new offspring are evaluated; the survivors keep their
+                fitness. Generation-based criteria then count these steps.
+
+        Termination criteria (all optional; see should_stop and run):
+            max_generations (int): Stop after this many generations.
+            target_fitness (float): Stop once the best fitness is within
+                target_tolerance of this value (e.g. the function's known optimum).
+            target_tolerance (float): How close to target_fitness counts as reached.
+            patience (int): Stop after this many generations without improvement.
+            min_diversity (float): Stop once diversity() falls below this value.
+            max_time (float): Stop after this many seconds of running generations.
+                A run resumed from a checkpoint keeps counting from the time
+                it had already used.
+            max_evaluations (int): Stop once this many objective evaluations were made.
+
+        Checkpointing (see save_checkpoint and load_checkpoint):
+            autosave_path (str): If set, write a checkpoint to this .npz file from a
+                background thread every autosave_every generations. Call close()
+                at the end of the run to wait for the last one.
+            autosave_every (int): Generations between autosaves.
+            record_history (bool): Keep the best fitness after every generation
+                in history (and in checkpoints). It grows with the run; for
+                long runs use a HistoryRecorder observer (see history.py),
+                which can keep a bounded, downsampled curve instead.
+        """
+        self.objective_func = objective_func
+        self.evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.bounds = bounds
+        self.dimension = dimension
+        self.pop_size = pop_size
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        # Every random draw goes through this generator, never the global state
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.carry_fitness = carry_fitness
+        self.cache = FitnessCache(cache_size) if cache_size > 0 else None
+        if not 0 <= elitism < pop_size:
+            raise ValueError("elitism must be between 0 and pop_size - 1")
+        if steady_state is not None and not 1 <= steady_state <= pop_size:
+            raise ValueError("steady_state must be between 1 and pop_size")
+        if steady_state is not None and elitism:
+            raise ValueError("elitism only applies to generational replacement")
+        self.elitism = elitism
+        self.steady_state = steady_state
+        self.dtype = np.dtype(dtype)
+
+        # Adaptive strategies and the values they adapt (see adaptation.py)
+        if isinstance(mutation_step, dict):
+            mutation_step = strategy_from_config(mutation_step)
+        if isinstance(rate_adaptation, dict):
+            rate_adaptation = strategy_from_config(rate_adaptation)
+        self.mutation_step = mutation_step
+        self.rate_adaptation = rate_adaptation
+        self._initial_rates = (crossover_rate, mutation_rate)
+        if rate_adaptation is not None:
+            self.crossover_rate = np.full(self._batch_shape[:-1], float(crossover_rate))
+            self.mutation_rate = np.full(self._batch_shape[:-1], float(mutation_rate))
+        self._self_adaptive = getattr(mutation_step, "self_adaptive", False)
+        self._learning = rate_adaptation is not None or getattr(mutation_step, "learns", False)
+        # A fixed step stays a float; strategies keep one value per run, or
+        # per individual as extra genome columns (see SelfAdaptiveStep)
+        self.step_size = mutation_step if np.isscalar(mutation_step) else mutation_step.initial_step_size(self)
+        self._spare_step_size = None
+        self._offspring_step_size = None
+        # Which offspring of the last generation were crossed over and
+        # mutated, and their parent's fitness, for the learning strategies
+        self._crossed = None
+        self._mutated = None
+        self._variation = None
+
+        # Counters of objective evaluations and of fitness values carried over
+        # from unchanged parents (cache hits are counted by self.cache)
+        self.evaluations = 0
+        self.fitness_carried = 0
+
+        # Lineage of the current population: the parent each row was selected
+        # from, and whether the row is still an unchanged copy of that parent.
+        # Filled in by the operators, consumed by the next fitness evaluation.
+        self._parent_indices = None
+        self._unchanged = None
+        self._carried_fitness = None
+
+        # Termination criteria and the progress they are checked against
+        self.max_generations = max_generations
+        self.target_fitness = target_fitness
+        self.target_tolerance = target_tolerance
+        self.patience = patience
+        self.min_diversity = min_diversity
+        self.max_time = max_time
+        self.max_evaluations = max_evaluations
+        self.generation = 0
+        self.stop_reason = None
+        self.stop_generation = None
+        # Evaluations and generations used until the target was first reached
+        self.evaluations_to_target = None
+        self.generations_to_target = None
+        self._last_improvement = 0
+        self._start_time = None
+        # Seconds already run before this GA was restored from a checkpoint
+        self._elapsed_before = 0.0
+
+        # Callbacks that receive per-generation statistics (see add_observer)
+        self.observers = []
+
+        # Best fitness after every generation (only with record_history), in a
+        # buffer that doubles as needed
+        self.record_history = record_history
+        self._history = None
+        self._history_len = 0
+
+        self._autosaver = Autosaver(autosave_path, autosave_every) if autosave_path is not None else None
+        
+        # Generations are double-buffered: offspring are written into the spare
+        # population array, which then swaps with the current one. Scratch
+        # arrays for the operators are likewise reused between generations.
+        self._spare_population = None
+        self._scratch = {}
+        self._scratch_views = {}
+
+        # Initialize the population
+        self.population = self._initialize_population()
+        self.best_solution = None
+        self.best_fitness = float('inf')
+
+    @property
+    def history(self):
+        """
+        The best fitness so far after each generation (one row per generation).
+        Empty unless the GA was created with record_history.
+        """
+        if self._history is None:
+            return np.empty(0)
+        return self._history[:self._history_len]
+
+    def _record_history(self):
+        """Appends the current best fitness to the history, growing the buffer if full."""
+        if self._history is None:
+            self._history = np.empty((64,) + np.shape(self.best_fitness))
+        elif self._history_len == len(self._history):
+            grown = np.empty((2 * len(self._history),) + self._history.shape[1:])
+            grown[:self._history_len] = self._history
+            self._history = grown
+        self._history[self._history_len] = self.best_fitness
+        self._history_len += 1
+
+    def _config(self):
+        """The constructor arguments needed to recreate this GA from a checkpoint."""
+        return {
+            "bounds": list(self.bounds),
+            "dimension": self.dimension,
+            "pop_size": self.pop_size,
+            "crossover_rate": self._initial_rates[0],
+            "mutation_rate": self._initial_rates[1],
+            "mutation_step": (self.mutation_step if np.isscalar(self.mutation_step)
+                              else strategy_config(self.mutation_step)),
+            "rate_adaptation": None if self.rate_adaptation is None else strategy_config(self.rate_adaptation),
+            "carry_fitness": self.carry_fitness,
+            "cache_size": self.cache.maxsize if self.cache is not None else 0,
+            "dtype": self.dtype.name,
+            "elitism": self.elitism,
+            "steady_state": self.steady_state,
+            "max_generations": self.max_generations,
+            "target_fitness": self.target_fitness,
+            "target_tolerance": self.target_tolerance,
+            "patience": self.patience,
+            "min_diversity": self.min_diversity,
+            "max_time": self.max_time,
+            "max_evaluations": self.max_evaluations,
+            "record_history": self.record_history,
+        }
+
+    def state_dict(self):
+        """
+        Returns a copy of the complete engine state: configuration, population,
+        carried-over fitness, cache contents, random generator state, counters
+        and history. Restoring it with load_state_dict continues the run
+        exactly as if it had never stopped.
+        """
+        state = {
+            "class": type(self).__name__,
+            "config": self._config(),
+            "rng_state": self.rng.bit_generator.state,
+            "generation": self.generation,
+            "evaluations": self.evaluations,
+            "fitness_carried": self.fitness_carried,
+            "elapsed_time": self.elapsed_time(),
+            "stop_reason": self.stop_reason,
+            "stop_generation": self.stop_generation,
+            "evaluations_to_target": self.evaluations_to_target,
+            "generations_to_target": self.generations_to_target,
+            "last_improvement": self._last_improvement,
+            "best_fitness": self.best_fitness,
+            "best_solution": self.best_solution,
+            "population": self.population,
+            "carried_fitness": self._carried_fitness,
+        }
+        if self.record_history:
+            state["history"] = self.history
+        if not np.isscalar(self.step_size):
+            state["step_size"] = self.step_size
+        if self.rate_adaptation is not None:
+            state["crossover_rate"], state["mutation_rate"] = self.crossover_rate, self.mutation_rate
+        if self._variation is not None:
+            state["variation_parent_fitness"], state["variation_crossed"], state["variation_mutated"] = self._variation
+        if self.cache is not None:
+            state["cache_keys"], state["cache_values"] = self.cache.to_arrays()
+            state["cache_hits"], state["cache_misses"] = self.cache.hits, self.cache.misses
+        # Copy the arrays, since the run may go on while the state is written
+        return {key: value.copy() if isinstance(value, np.ndarray) else value for key, value in state.items()}
+
+    def load_state_dict(self, state):
+        """Restores the engine state from a dict returned by state_dict."""
+        rng_state = state["rng_state"]
+        self.rng = np.random.Generator(getattr(np.random, rng_state["bit_generator"])())
+        self.rng.bit_generator.state = rng_state
+        self.generation = state["generation"]
+        self.evaluations = state["evaluations"]
+        self.fitness_carried = state["fitness_carried"]
+        self.stop_reason = state["stop_reason"]
+        self.stop_generation = state["stop_generation"]
+        self.evaluations_to_target = state["evaluations_to_target"]
+        self.generations_to_target = state["generations_to_target"]
+        self._last_improvement = state["last_improvement"]
+        self.best_fitness = state["best_fitness"]
+        self.best_solution = state["best_solution"]
+        self.population = state["population"]
+        self._carried_fitness = state["carried_fitness"]
+        if self.record_history and "history" in state:
+            self._history = np.array(state["history"])
+            self._history_len = len(self._history)
+        if "step_size" in state:
+            self.step_size = state["step_size"]
+        if "crossover_rate" in state:
+            self.crossover_rate, self.mutation_rate = state["crossover_rate"], state["mutation_rate"]
+        if "variation_parent_fitness" in state:
+            self._variation = (state["variation_parent_fitness"], state["variation_crossed"],
+                               state["variation_mutated"])
+        if self.cache is not None and "cache_keys" in state:
+            self.cache.load_arrays(state["cache_keys"], state["cache_values"])
+            self.cache.hits, self.cache.misses = state["cache_hits"], state["cache_misses"]
+        self._start_time = None
+        self._elapsed_before = state.get("elapsed_time", 0.0)
+
+    def save_checkpoint(self, path, compress=False):
+        """Writes the complete engine state to an .npz file (see checkpoint.py)."""
+        write_checkpoint(self.state_dict(), path, compress)
+
+    @classmethod
+    def load_checkpoint(cls, path, objective_func, **kwargs):
+        """
+        Recreates a GA from a checkpoint file. The objective function is not
+        stored in the checkpoint and must be passed again; any other keyword
+        arguments (e.g. evaluator, autosave_path) override the saved config.
+        """
+        state = read_checkpoint(path)
+        if state["class"] != cls.__name__:
+            raise ValueError(f"Checkpoint holds a {state['class']}, not a {cls.__name__}")
+        config = {**state["config"], **kwargs}
+        config["bounds"] = tuple(config["bounds"])
+        ga = cls(objective_func, **config)
+        ga.load_state_dict(state)
+        return ga
+
+    def close(self):
+        """Waits for any checkpoint still being written by the autosaver."""
+        if self._autosaver is not None:
+            self._autosaver.close()
+
+    def spawn_rngs(self, n_streams):
+        """Spawns n_streams independent child generators from this GA's generator."""
+        return self.rng.spawn(n_streams)
+
+    @property
+    def _batch_shape(self):
+        """
+        Shape of the population without its gene axis. The operators below work
+        on any leading shape, so subclasses (see multi_run.MultiRunGA) can add
+        a leading axis of independent runs.
+        """
+        return (self.pop_size,)
+
+    def _flat_indices(self, indices):
+        """
+        Converts population indices (as drawn by the operators) into row
+        indices of the population flattened to (-1, dimension). With a single
+        run they are already the same.
+        """
+        return indices
+
+    def _per_run(self, value, n_axes):
+        """
+        Appends n_axes axes to a per-run array of adapted values (see
+        adaptation.py) so it broadcasts against an operator's arrays. Fixed
+        (float) settings are returned as they are.
+        """
+        if isinstance(value, np.ndarray):
+            return value.reshape(value.shape + (1,) * n_axes)
+        return value
+
+    def _initialize_population(self):
+        """Creates the initial population as a numpy array."""
+        min_b, max_b = self.bounds
+        population = self.rng.random(self._batch_shape + (self.dimension,), dtype=self.dtype)
+        population *= max_b - min_b
+        population += min_b
+        return population
+
+    def _offspring_buffer(self, n_offspring):
+        """
+        Returns the spare population array (allocated on first use) to write
+        n_offspring offspring per run into.
+        """
+        spare = self._spare_population
+        if spare is None or spare.shape != self.population.shape or spare.dtype != self.population.dtype:
+            spare = self._spare_population = np.empty_like(self.population)
+        return spare[..., :n_offspring, :]
+
+    def _scratch_array(self, name, shape, dtype):
+        """Returns a reusable scratch array, grown when a larger one is needed."""
+        view = self._scratch_views.get((name, shape, dtype))
+        if view is not None:
+            return view
+        size = math.prod(shape)
+        buffer = self._scratch.get(name)
+        if buffer is None or buffer.size < size or buffer.dtype != dtype:
+            buffer = self._scratch[name] = np.empty(size, dtype=dtype)
+            # Views of the old buffer are dropped along with it
+            self._scratch_views = {key: value for key, value in self._scratch_views.items() if key[0] != name}
+        view = self._scratch_views[(name, shape, dtype)] = buffer[:size].reshape(shape)
+        return view
+
+    def _evaluate_fitness(self):
+        """
+        Calculates the fitness for each individual in the population.
+        Individuals that are unchanged copies of a parent reuse its fitness;
+        the rest are looked up in the cache (if any) and then evaluated.
+        """
+        if self._carried_fitness is None:
+            individuals = self.population.reshape(-1, self.dimension)
+            return self._lookup_or_evaluate(individuals).reshape(self._batch_shape)
+
+        fitness = self._carried_fitness
+        self._carried_fitness = None
+        # Gathering the pending rows copies them, so it is done in chunks of
+        # bounded size for high-dimensional populations
+        flat_fitness = fitness.reshape(-1)
+        pending = np.flatnonzero(np.isnan(flat_fitness))
+        self.fitness_carried += fitness.size - len(pending)
+        individuals = self.population.reshape(-1, self.dimension)
+        chunk_size = max(1, CHUNK_BYTES // (8 * self.dimension))
+        for start in range(0, len(pending), chunk_size):
+            rows = pending[start:start + chunk_size]
+            flat_fitness[rows] = self._lookup_or_evaluate(individuals[rows])
+        return fitness
+
+    def _lookup_or_evaluate(self, individuals):
+        """Evaluates a (n, dimension) matrix of individuals, through the cache if any."""
+        if self.cache is not None:
+            return self.cache.evaluate(self._evaluate_individuals, individuals)
+        return self._evaluate_individuals(individuals)
+
+    def _evaluate_individuals(self, individuals):
+        """Runs the objective on the given rows through the evaluator."""
+        self.evaluations += len(individuals)
+        return self.evaluator.evaluate(self.objective_func, individuals)
+
+    def current_fitness(self):
+        """
+        Returns the fitness of the current population, evaluating it if needed.
+        The values are kept for the next generation, so calling this between
+        generations costs no extra evaluations.
+        """
+        fitness = self._evaluate_fitness()
+        self._carried_fitness = fitness
+        return fitness.copy()
+
+    def replace_individuals(self, indices, individuals, fitness):
+        """
+        Overwrites the given rows of the current population (e.g. with
+        migrants from another population) whose fitness is already known.
+        Call current_fitness first so the rest of the population has known
+        fitness too.
+        """
+        self.population[indices] = individuals
+        # Self-adaptive step sizes of the replaced rows are kept, and the
+        # newcomers do not count as offspring for the learning strategies
+        if self._variation is not None:
+            self._variation[1][indices] = False
+            self._variation[2][indices] = False
+        if self._carried_fitness is None:
+            self._carried_fitness = np.full(self._batch_shape, np.nan)
+        self._carried_fitness[indices] = fitness
+
+    def _selection(self, fitness, n_parents=None):
+        """
+        Selects parents for the next generation using tournament selection.
+        This method is generally more efficient and less prone to premature
+        convergence than other methods like roulette wheel.
+        All binary tournaments are drawn at once as a (n_parents, 2) index
+        array; n_parents defaults to the population size. The parents are
+        copied straight into the spare population array.
+        """
+        n_parents = self.pop_size if n_parents is None else n_parents
+        contestants = self.rng.integers(0, self.pop_size, self._batch_shape[:-1] + (n_parents, 2))
+        i, j = contestants[..., 0], contestants[..., 1]
+        # The individual with the better (lower) fitness wins
+        flat_fitness = fitness.reshape(-1)
+        winners = np.where(flat_fitness[self._flat_indices(i)] < flat_fitness[self._flat_indices(j)], i, j)
+        self._parent_indices = winners
+        parents = self._offspring_buffer(n_parents)
+        # mode='clip' lets take write into the (strided) buffer without an
+        # intermediate copy; the indices are always in range
+        np.take(self.population.reshape(-1, self.dimension), self._flat_indices(winners), axis=0,
+                out=parents, mode='clip')
+        if self._self_adaptive:
+            self._select_step_size(winners)
+        return parents
+
+    def _select_step_size(self, winners):
+        """
+        Copies the self-adaptive step sizes of the selected parents into the
+        spare step size array, where they follow the offspring through
+        crossover, mutation and replacement like extra genome columns.
+        """
+        spare = self._spare_step_size
+        if spare is None or spare.shape != self.step_size.shape:
+            spare = self._spare_step_size = np.empty_like(self.step_size)
+        n_columns = self.step_size.shape[-1]
+        self._offspring_step_size = spare[..., :winners.shape[-1], :]
+        np.take(self.step_size.reshape(-1, n_columns), self._flat_indices(winners), axis=0,
+                out=self._offspring_step_size, mode='clip')
+
+    def _crossover(self, parents):
+        """
+        Performs crossover on the selected parents to create offspring.
+        Uses a simple one-point crossover, applied to all pairs at once: each
+        pair gets a cut point, and the genes right of the cut are swapped
+        between the two parents, in place. Pairs that do not cross over get a
+        cut point past the last gene, so both children are copies of their
+        parents.
+        """
+        n_pairs = parents.shape[-2] // 2
+        pairs_shape = parents.shape[:-2] + (n_pairs,)
+        first, second = slice(0, 2 * n_pairs, 2), slice(1, 2 * n_pairs, 2)
+        p1, p2 = parents[..., first, :], parents[..., second, :]
+
+        do_crossover = self.rng.random(pairs_shape) < self._per_run(self.crossover_rate, 1)
+        cut_points = np.where(do_crossover, self.rng.integers(1, max(self.dimension, 2), pairs_shape), self.dimension)
+        swap = self._scratch_array("mask", pairs_shape + (self.dimension,), bool)
+        np.greater_equal(np.arange(self.dimension), cut_points[..., None], out=swap)
+
+        # Both parents go through scratch copies: copying between p1 and p2
+        # directly would make NumPy allocate a temporary, as they share memory.
+        # With an odd population the last parent has no partner and stays as is.
+        saved = self._scratch_array("genes", (2,) + p1.shape, parents.dtype)
+        np.copyto(saved[0], p1)
+        np.copyto(saved[1], p2)
+        np.copyto(p1, saved[1], where=swap)
+        np.copyto(p2, saved[0], where=swap)
+
+        # Self-adaptive step sizes are columns after the last gene, so every
+        # pair that crosses over swaps them
+        if self._offspring_step_size is not None:
+            steps = self._offspring_step_size
+            s1, s2 = steps[..., first, :], steps[..., second, :]
+            saved = self._scratch_array("steps", (2,) + s1.shape, steps.dtype)
+            np.copyto(saved[0], s1)
+            np.copyto(saved[1], s2)
+            np.copyto(s1, saved[1], where=do_crossover[..., None])
+            np.copyto(s2, saved[0], where=do_crossover[..., None])
+
+        self._unchanged = np.ones(parents.shape[:-1], dtype=bool)
+        self._unchanged[..., first] = ~do_crossover
+        self._unchanged[..., second] = ~do_crossover
+        if self._learning:
+            self._crossed = ~self._unchanged
+        return parents
+
+    def _mutation(self, offspring):
+        """
+        Applies mutation to the offspring.
+        Adds a small random value from a Gaussian distribution to each gene
+        based on the mutation probability. The whole matrix is mutated in place
+        using a Bernoulli mask, then clipped back into the bounds. The random
+        draws go into reused scratch arrays of the offspring's dtype. The
+        noise's standard deviation is step_size (see mutation_step).
+        """
+        if self._self_adaptive:
+            # The offspring's own step sizes are mutated before their genes
+            self.mutation_step.mutate(self, self._offspring_step_size)
+            step_size = self._offspring_step_size
+        else:
+            step_size = self.step_size
+        mutate = self._scratch_array("mask", offspring.shape, bool)
+        draws = self._scratch_array("genes", offspring.shape, offspring.dtype)
+        self.rng.random(out=draws, dtype=draws.dtype)
+        np.less(draws, self._per_run(self.mutation_rate, 2), out=mutate)
+        # Standard normal noise scaled by the step size; with the default fixed
+        # step of 0.1 this is the same stream as normal(0, 0.1)
+        self.rng.standard_normal(out=draws, dtype=draws.dtype)
+        draws *= step_size
+        np.add(offspring, draws, out=offspring, where=mutate)
+        mutated = mutate.any(axis=-1)
+        if self._unchanged is not None:
+            self._unchanged &= ~mutated
+        if self._learning:
+            self._mutated = mutated
+        # Clip the values to stay within the defined bounds
+        np.clip(offspring, self.bounds[0], self.bounds[1], out=offspring)
+        return offspring
+
+    def _keep_elites(self, fitness, offspring):
+        """
+        Overwrites the first offspring with unchanged copies of the elitism
+        best individuals of the current population.
+        """
+        elites = np.argpartition(fitness, self.elitism - 1, axis=-1)[..., :self.elitism]
+        offspring[..., :self.elitism, :] = self.population.reshape(-1, self.dimension)[self._flat_indices(elites)]
+        self._parent_indices[..., :self.elitism] = elites
+        self._unchanged[..., :self.elitism] = True
+        if self._self_adaptive:
+            n_columns = self.step_size.shape[-1]
+            self._offspring_step_size[..., :self.elitism, :] = \
+                self.step_size.reshape(-1, n_columns)[self._flat_indices(elites)]
+        if self._learning:
+            self._crossed[..., :self.elitism] = False
+            self._mutated[..., :self.elitism] = False
+
+    def _replace_worst(self, fitness, offspring):
+        """
+        Steady-state replacement: the offspring overwrite the worst individuals
+        of the population in place. The survivors keep their fitness, so the
+        next evaluation only covers the new offspring (and not even those that
+        are unchanged copies of their parent, with carry_fitness).
+        """
+        worst = np.argpartition(fitness, -self.steady_state, axis=-1)[..., -self.steady_state:]
+        np.put_along_axis(self.population, worst[..., None], offspring, axis=-2)
+        if self._self_adaptive:
+            np.put_along_axis(self.step_size, worst[..., None], self._offspring_step_size, axis=-2)
+        if self._learning:
+            self._record_variation(fitness, worst)
+
+        offspring_fitness = np.full(worst.shape, np.nan)
+        if self.carry_fitness:
+            parent_fitness = fitness.reshape(-1)[self._flat_indices(self._parent_indices)]
+            offspring_fitness[self._unchanged] = parent_fitness[self._unchanged]
+        self._carried_fitness = fitness.copy()
+        np.put_along_axis(self._carried_fitness, worst, offspring_fitness, axis=-1)
+
+    def _record_variation(self, fitness, rows=None):
+        """
+        Keeps what the learning strategies need to know about the offspring
+        just created: their parent's fitness and which of them were crossed
+        over and mutated. rows are the offspring's positions in the population
+        (steady-state replacement), or None when they are the whole population.
+        """
+        parent_fitness = fitness.reshape(-1)[self._flat_indices(self._parent_indices)]
+        record = (parent_fitness, self._crossed, self._mutated)
+        if rows is not None:
+            # The survivors are not offspring: they never count as crossed or mutated
+            full = (np.full(self._batch_shape, np.inf), np.zeros(self._batch_shape, dtype=bool),
+                    np.zeros(self._batch_shape, dtype=bool))
+            for array, values in zip(full, record):
+                np.put_along_axis(array, rows, values, axis=-1)
+            record = full
+        self._variation = record
+        self._crossed = self._mutated = None
+
+    def _adapt(self, fitness):
+        """
+        Passes the outcome of the last generation's offspring, now that they
+        are evaluated, to the learning strategies (see adaptation.py).
+        """
+        parent_fitness, crossed, mutated = self._variation
+        self._variation = None
+        improved = fitness < parent_fitness
+        if self.rate_adaptation is not None:
+            self.rate_adaptation.update(self, improved, crossed, mutated)
+        if getattr(self.mutation_step, "learns", False):
+            self.mutation_step.update(self, improved, crossed, mutated)
+
+    def _update_best(self, fitness):
+        """Updates the best solution found so far from the current fitness."""
+        current_best_idx = np.argmin(fitness)
+        if fitness[current_best_idx] < self.best_fitness:
+            self.best_fitness = fitness[current_best_idx]
+            # A copy, since the population it comes from is overwritten later
+            self.best_solution = self.population[current_best_idx].copy()
+            self._last_improvement = self.generation
+
+    def _target_reached(self):
+        """Returns whether the best fitness is within tolerance of the target."""
+        return self.best_fitness <= self.target_fitness + self.target_tolerance
+
+    def _track_target(self):
+        """Records the cost of reaching the target fitness the first time it is reached."""
+        if self.evaluations_to_target is None and self._target_reached():
+            self.evaluations_to_target = self.evaluations
+            self.generations_to_target = self.generation + 1
+
+    def diversity(self, population=None):
+        """
+        Measures how spread out the population (by default the current one)
+        is: the standard deviation of each gene across the population,
+        averaged over the genes and divided by the width of the bounds. It is
+        0 when all individuals are equal.
+        """
+        if population is None:
+            population = self.population
+        min_b, max_b = self.bounds
+        return np.std(population, axis=-2).mean(axis=-1) / (max_b - min_b)
+
+    def elapsed_time(self):
+        """
+        Seconds since the first generation started, including the time used
+        before the run was checkpointed and resumed. Checked against max_time.
+        """
+        if self._start_time is None:
+            return self._elapsed_before
+        return time.perf_counter() - self._start_time
+
+    def _evaluations_used(self):
+        """The evaluation count that max_evaluations is checked against."""
+        return self.evaluations
+
+    def _termination_reason(self):
+        """Returns the name of the first termination criterion met, or None."""
+        if self.target_fitness is not None and np.all(self._target_reached()):
+            return "target"
+        if self.max_evaluations is not None and np.all(self._evaluations_used() >= self.max_evaluations):
+            return "max_evaluations"
+        if self.max_time is not None and self.elapsed_time() >= self.max_time:
+            return "max_time"
+        if self.max_generations is not None and self.generation >= self.max_generations:
+            return "max_generations"
+        if self.patience is not None and np.all(self.generation - self._last_improvement >= self.patience):
+            return "stagnation"
+        if self.min_diversity is not None and np.all(self.diversity() < self.min_diversity):
+            return "diversity"
+        return None
+
+    def should_stop(self):
+        """
+        Checks the termination criteria. When one is met, records it in
+        stop_reason (with the generation in stop_generation) and returns True.
+        """
+        if self.stop_reason is None:
+            self.stop_reason = self._termination_reason()
+            if self.stop_reason is not None:
+                self.stop_generation = self.generation
+        return self.stop_reason is not None
+
+    def run(self):
+        """
+        Runs generations until a termination criterion is met. At least one
+        criterion (e.g. max_generations) must be set.
+        """
+        criteria = (self.max_generations, self.target_fitness, self.patience,
+                    self.min_diversity, self.max_time, self.max_evaluations)
+        if all(criterion is None for criterion in criteria):
+            raise ValueError("run() needs at least one termination criterion")
+        while not self.should_stop():
+            self.run_generation()
+        return self.best_solution, self.best_fitness
+
+    def add_observer(self, observer):
+        """
+        Registers a callback that is called after every generation with a dict
+        of statistics (see _generation_stats). The sinks in metrics.py are
+        ready-made observers. Timing and statistics are only computed while at
+        least one observer is registered.
+        """
+        self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Unregisters a callback added with add_observer."""
+        self.observers.remove(observer)
+
+    def _generation_stats(self, fitness, population, timings):
+        """
+        Builds the statistics passed to observers for the generation that just
+        ran. Fitness statistics and diversity describe the population that was
+        evaluated in this generation; for a MultiRunGA they are pooled over
+        all runs and best_fitness is the best over all runs.
+        """
+        t_start, t_evaluate, t_select, t_crossover, t_mutate, t_end = timings
+        return {
+            "generation": self.generation,
+            "best_fitness": float(np.min(self.best_fitness)),
+            "generation_best": float(np.min(fitness)),
+            "mean_fitness": float(np.mean(fitness)),
+            "std_fitness": float(np.std(fitness)),
+            "diversity": float(np.mean(self.diversity(population))),
+            "evaluations": int(self.evaluations),
+            "fitness_carried": int(self.fitness_carried),
+            "time_evaluate": t_evaluate - t_start,
+            "time_selection": t_select - t_evaluate,
+            "time_crossover": t_crossover - t_select,
+            "time_mutation": t_mutate - t_crossover,
+            "time_generation": t_end - t_start,
+        }
+
+    def run_generation(self):
+        """
+        Executes one full generation of the Genetic Algorithm.
+        This includes evaluation, selection, crossover, and mutation.
+        """
+        if self._start_time is None:
+            self._start_time = time.perf_counter() - self._elapsed_before
+        # Stage timings are only taken when someone is observing
+        clock = time.perf_counter if self.observers else _no_clock
+        t_start = clock()
+
+        # 1. Evaluate fitness of the current population
+        fitness = self._evaluate_fitness()
+        t_evaluate = clock()
+        
+        # 2. Update the best solution found so far
+        self._update_best(fitness)
+        if self.target_fitness is not None:
+            self._track_target()
+        if self._variation is not None:
+            self._adapt(fitness)
+            
+        # 3. Select parents for the next generation (only as many as there
+        # are offspring to replace in steady-state mode)
+        if self.steady_state is None:
+            parents = self._selection(fitness)
+        else:
+            parents = self._selection(fitness, self.steady_state)
+        t_select = clock()
+        
+        # 4. Create offspring through crossover
+        offspring = self._crossover(parents)
+        t_crossover = clock()
+        
+        # 5. Apply mutation to the offspring
+        mutated_offspring = self._mutation(offspring)
+        t_mutate = clock()
+        
+        # 6. Replace the old population with the new generation, or only its
+        # worst individuals in steady-state mode
+        evaluated_population = self.population
+        if self.steady_state is None:
+            if self.elitism:
+                self._keep_elites(fitness, mutated_offspring)
+            self._spare_population = self.population
+            self.population = mutated_offspring
+            if self._self_adaptive:
+                self._spare_step_size, self.step_size = self.step_size, self._offspring_step_size
+            if self._learning:
+                self._record_variation(fitness)
+        else:
+            evaluated_population = self.population.copy() if self.observers else None
+            self._replace_worst(fitness, mutated_offspring)
+
+        # 7. Offspring that are exact copies of their parent keep its fitness
+        if self.steady_state is None and self.carry_fitness:
+            parent_fitness = fitness.reshape(-1)[self._flat_indices(self._parent_indices)]
+            self._carried_fitness = np.where(self._unchanged, parent_fitness, np.nan)
+        self._unchanged = None
+        self._offspring_step_size = None
+        self.generation += 1
+        if self.record_history:
+            self._record_history()
+
+        if self.observers:
+            timings = (t_start, t_evaluate, t_select, t_crossover, t_mutate, clock())
+            stats = self._generation_stats(fitness, evaluated_population, timings)
+            for observer in self.observers:
+                observer(stats)
+
+        if self._autosaver is not None:
+            self._autosaver.after_generation(self)
+        
+        # Return current bests for UI update
+        return self.best_solution, self.best_fitness
\ No newline at end of file
@@ -0,0 +1,196 @@
+# This file defines HistoryRecorder, which records per-generation values
+# (best fitness, and optionally mean/std fitness, diversity, ...) with
+# bounded memory. Next to the full series, kept in a preallocated NumPy
+# buffer or an append-only file on disk, it maintains a downsampled copy of
+# at most max_points buckets holding each bucket's min and max. When the
+# buckets fill up, neighbouring pairs are merged, so plotting a run costs the
+# same whether it lasted a thousand generations or a million:
+#
+#     recorder = HistoryRecorder(("best_fitness", "mean_fitness", "diversity"))
+#     ga.add_observer(recorder)
+#     ...
+#     generations, low, high = recorder.downsampled("best_fitness")
+
+import numpy as np
+
+class HistoryRecorder:
+    """
+    Records one row of values per generation and keeps a min/max downsampled
+    copy of at most max_points buckets.
+    """
+    def __init__(self, fields=("best_fitness",), shape=(), max_points=1000, path=None, keep_full=True):
+        """
+        Args:
+            fields (tuple): The names of the recorded values. When used as an
+                observer, these are keys of the statistics dict.
+            shape (tuple): The shape of each value, e.g. (n_runs,) to record
+                the best fitness of every run of a MultiRunGA.
+            max_points (int): The maximum number of downsampled buckets
+                (rounded down to an even number).
+            path (str): If given, the full series is appended to this raw
+                float64 file instead of being kept in memory, and values()
+                memory-maps it.
+            keep_full (bool): Keep the full series at all. Without it only the
+                downsampled buckets are kept, so memory stays fixed.
+        """
+        if max_points < 2:
+            raise ValueError("max_points must be at least 2")
+        self.fields = tuple(fields)
+        self.path = path
+        self.keep_full = keep_full or path is not None
+        self._row_shape = (len(self.fields),) + tuple(shape)
+        self._length = 0
+
+        # Downsampled buckets: bucket i covers rows [i * width, (i + 1) * width)
+        self.max_points = max_points - max_points % 2
+        self._low = np.empty((self.max_points,) + self._row_shape)
+        self._high = np.empty((self.max_points,) + self._row_shape)
+        self._n_buckets = 0
+        self._bucket_width = 1
+        self._bucketed = 0
+
+        self._full = None
+        self._file = None
+        if path is not None:
+            self._file = open(path, "wb")
+        elif self.keep_full:
+            self._full = np.empty((64,) + self._row_shape)
+
+    def __len__(self):
+        return self._length
+
+    def __call__(self, stats):
+        self.append(*(stats[field] for field in self.fields))
+
+    def append(self, *values):
+        """Records one generation: one value per field."""
+        self.extend(np.asarray(values, dtype=float)[None])
+
+    def extend(self, rows):
+        """
+        Records several generations at once. rows has one row per generation;
+        with a single field the field axis may be left out.
+        """
+        rows = np.asarray(rows, dtype=float).reshape((-1,) + self._row_shape)
+        if len(rows) == 0:
+            return
+        self._store_full(rows)
+        self._length += len(rows)
+
+        while len(rows):
+            # Top up the last bucket if it is not full yet
+            fill = self._bucket_fill()
+            if 0 < fill < self._bucket_width:
+                take = min(len(rows), self._bucket_width - fill)
+                last = self._n_buckets - 1
+                np.minimum(self._low[last], rows[:take].min(axis=0), out=self._low[last])
+                np.maximum(self._high[last], rows[:take].max(axis=0), out=self._high[last])
+                self._bucketed += take
+                rows = rows[take:]
+                continue
+            if self._n_buckets == self.max_points:
+                self._compact()
+                continue
+
+            # Open as many new buckets as the rows (and free buckets) allow
+            width = self._bucket_width
+            n_new = min(-(-len(rows) // width), self.max_points - self._n_buckets)
+            whole = min(n_new, len(rows) // width)
+            start = self._n_buckets
+            if whole:
+                chunks = rows[:whole * width].reshape((whole, width) + self._row_shape)
+                self._low[start:start + whole] = chunks.min(axis=1)
+                self._high[start:start + whole] = chunks.max(axis=1)
+            if n_new > whole:
+                rest = rows[whole * width:]
+                self._low[start + whole] = rest.min(axis=0)
+                self._high[start + whole] = rest.max(axis=0)
+            taken = min(len(rows), n_new * width)
+            self._n_buckets += n_new
+            self._bucketed += taken
+            rows = rows[taken:]
+
+    def _bucket_fill(self):
+        """Returns how many rows the last bucket holds (0 if there are none)."""
+        if self._n_buckets == 0:
+            return 0
+        return self._bucketed - (self._n_buckets - 1) * self._bucket_width
+
+    def _compact(self):
+        """Merges neighbouring pairs of (full) buckets, halving their number."""
+        half = self._n_buckets // 2
+        low = self._low[:self._n_buckets].reshape((half, 2) + self._row_shape)
+        high = self._high[:self._n_buckets].reshape((half, 2) + self._row_shape)
+        self._low[:half] = low.min(axis=1)
+        self._high[:half] = high.max(axis=1)
+        self._n_buckets = half
+        self._bucket_width *= 2
+
+    def _store_full(self, rows):
+        """Appends rows to the full series, in memory or on disk."""
+        if self._file is not None:
+            self._file.write(rows.tobytes())
+        elif self._full is not None:
+            needed = self._length + len(rows)
+            if needed > len(self._full):
+                grown = np.empty((max(needed, 2 * len(self._full)),) + self._row_shape)
+                grown[:self._length] = self._full[:self._length]
+                self._full = grown
+            self._full[self._length:needed] = rows
+
+    def _field_index(self, field):
+        return 0 if field is None else self.fields.index(field)
+
+    def values(self, field=None):
+        """
+        Returns the full series of one field (the first by default), one entry
+        per recorded generation. With a path this is a read-only memory map.
+        """
+        if not self.keep_full:
+            raise ValueError("This recorder only keeps the downsampled history")
+        if self._file is not None:
+            self._file.flush()
+            if self._length == 0:
+                return np.empty((0,) + self._row_shape[1:])
+            full = np.memmap(self.path, dtype=float, mode="r", shape=(self._length,) + self._row_shape)
+        else:
+            full = self._full[:self._length]
+        return full[:, self._field_index(field)]
+
+    def downsampled(self, field=None):
+        """
+        Returns the downsampled series of one field (the first by default).
+        Returns:
+            tuple: (generations, low, high) where generations is the first
+                generation (1-based) of each bucket and low/high are the
+                minimum and maximum of the field within it.
+        """
+        index = self._field_index(field)
+        generations = np.arange(self._n_buckets) * self._bucket_width + 1
+        return (generations,
+                self._low[:self._n_buckets, index].copy(),
+                self._high[:self._n_buckets, index].copy())
+
+    def save(self, path):
+        """
+        Writes the recorded history to an .npz file: the downsampled
+        generations plus <field>_low/<field>_high arrays, and the full <field>
+        series when it is kept.
+        """
+        arrays = {"generations": self.downsampled()[0]}
+        for field in self.fields:
+            _, arrays[f"{field}_low"], arrays[f"{field}_high"] = self.downsampled(field)
+            if self.keep_full:
+                arrays[field] = np.asarray(self.values(field))
+        np.savez(path, **arrays)
+
+    def close(self):
+        """Closes the file backing the full series, if any."""
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,206 @@
+# This file defines IslandModel, an island-model Genetic Algorithm. The total
+# population is split into K islands that evolve independently (each in its
+# own process by default) and periodically exchange their best individuals
+# along a migration topology. Isolated islands keep more diversity than one
+# big panmictic population, which helps on multimodal functions such as
+# Rastrigin and Schwefel, and the islands use one core each.
+
+import multiprocessing
+import traceback
+
+import numpy as np
+
+from .genetic_algorithm import TARGET_TOLERANCE, GeneticAlgorithm
+
+TOPOLOGIES = ("ring", "fully_connected")
+
+class _Island:
+    """
+    One island: a GeneticAlgorithm plus the migration steps. The same class
+    runs in-process or inside a worker process (see _island_process).
+    """
+    def __init__(self, objective_func, bounds, dimension, n_migrants, seed, ga_kwargs):
+        self.n_migrants = n_migrants
+        self.ga = GeneticAlgorithm(objective_func, bounds, dimension, rng=np.random.default_rng(seed), **ga_kwargs)
+
+    def step(self, immigrants, n_generations):
+        """
+        Replaces the worst individuals with the immigrants (if any), evolves
+        for n_generations and returns this island's emigrants and progress.
+        """
+        if immigrants is not None:
+            individuals, fitness = immigrants
+            worst = np.argsort(self.ga.current_fitness())[-len(individuals):]
+            self.ga.replace_individuals(worst, individuals, fitness)
+
+        for _ in range(n_generations):
+            self.ga.run_generation()
+
+        fitness = self.ga.current_fitness()
+        best = np.argsort(fitness)[:self.n_migrants]
+        return {
+            "emigrants": (self.ga.population[best].copy(), fitness[best]),
+            "best_fitness": float(self.ga.best_fitness),
+            "best_solution": np.array(self.ga.best_solution),
+            "evaluations": self.ga.evaluations,
+        }
+
+def _island_process(conn, island_args):
+    """
+    Worker process loop: runs step requests from the coordinator until told to
+    stop. Replies with (report, None), or with (None, (exception, traceback))
+    if the island failed, e.g. in the objective function, and then exits.
+    """
+    try:
+        island = _Island(*island_args)
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            conn.send((island.step(*message), None))
+    except Exception as error:
+        details = traceback.format_exc()
+        try:
+            conn.send((None, (error, details)))
+        except Exception:
+            # The exception itself could not be pickled
+            conn.send((None, (RuntimeError(f"{type(error).__name__}: {error}"), details)))
+    conn.close()
+
+class IslandModel:
+    """
+    Evolves n_islands GeneticAlgorithm populations that exchange migrants
+    every migration_interval generations.
+    """
+    def __init__(self, objective_func, bounds, dimension, n_islands=4, pop_size=250, topology="ring",
+                 migration_interval=20, n_migrants=5, seed=None, processes=True, mp_context=None, **ga_kwargs):
+        """
+        Initializes the islands.
+        Args:
+            objective_func (function): The function to be minimized. Must be
+                picklable (e.g. a module-level function) when processes is set.
+            bounds (tuple): A tuple (min_val, max_val) for the search space.
+            dimension (int): The number of dimensions for the problem.
+            n_islands (int): The number of islands.
+            pop_size (int): The population size of each island.
+            topology (str): "ring" (island i sends to island i+1) or
+                "fully_connected" (each island receives the best migrants of
+                all the others).
+            migration_interval (int): Generations between migrations.
+            n_migrants (int): How many of its best individuals an island sends,
+                replacing the receiver's worst individuals.
+            seed (int): Master seed; each island gets an independent stream.
+            processes (bool): Run each island in its own process. When False
+                the islands run one after another in this process, with
+                identical results.
+            mp_context: A multiprocessing context (e.g. for the 'spawn' method).
+            **ga_kwargs: Other GeneticAlgorithm arguments for every island
+                (rates, carry_fitness, cache_size, ...).
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology {topology!r}, expected one of {TOPOLOGIES}")
+        if n_migrants > pop_size:
+            raise ValueError("n_migrants cannot exceed pop_size")
+        self.n_islands = n_islands
+        self.topology = topology
+        self.migration_interval = migration_interval
+        self.n_migrants = n_migrants
+        self.generation = 0
+        self.evaluations = 0
+        self.best_fitness = float('inf')
+        self.best_solution = None
+        self.island_best_fitness = [float('inf')] * n_islands
+        self._immigrants = [None] * n_islands
+
+        seeds = np.random.SeedSequence(seed).spawn(n_islands)
+        island_args = [(objective_func, bounds, dimension, n_migrants, island_seed, dict(ga_kwargs, pop_size=pop_size))
+                       for island_seed in seeds]
+        self._islands = []
+        self._connections = []
+        self._processes = []
+        if processes:
+            context = mp_context or multiprocessing.get_context()
+            for args in island_args:
+                parent_conn, child_conn = context.Pipe()
+                process = context.Process(target=_island_process, args=(child_conn, args), daemon=True)
+                process.start()
+                child_conn.close()
+                self._connections.append(parent_conn)
+                self._processes.append(process)
+        else:
+            self._islands = [_Island(*args) for args in island_args]
+
+    def _step_all(self, n_generations):
+        """Runs one epoch on every island (in parallel when using processes)."""
+        if self._islands:
+            return [island.step(immigrants, n_generations) for island, immigrants in zip(self._islands, self._immigrants)]
+        for conn, immigrants in zip(self._connections, self._immigrants):
+            conn.send((immigrants, n_generations))
+        # Every reply is received before raising, so the pipes stay in step
+        replies = [conn.recv() for conn in self._connections]
+        for island, (_, failure) in enumerate(replies):
+            if failure is not None:
+                error, details = failure
+                error.add_note(f"Raised in island {island}'s process:\n{details}")
+                raise error
+        return [report for report, _ in replies]
+
+    def _migrate(self, reports):
+        """Chooses each island's immigrants for the next epoch from the emigrants."""
+        emigrants = [report["emigrants"] for report in reports]
+        if self.n_islands == 1:
+            return [None]
+        if self.topology == "ring":
+            return [emigrants[i - 1] for i in range(self.n_islands)]
+        immigrants = []
+        for i in range(self.n_islands):
+            individuals = np.concatenate([emigrants[j][0] for j in range(self.n_islands) if j != i])
+            fitness = np.concatenate([emigrants[j][1] for j in range(self.n_islands) if j != i])
+            best = np.argsort(fitness)[:self.n_migrants]
+            immigrants.append((individuals[best], fitness[best]))
+        return immigrants
+
+    def run(self, max_generations, target_fitness=None, target_tolerance=TARGET_TOLERANCE):
+        """
+        Runs every island for max_generations generations, migrating every
+        migration_interval generations. Stops early (at the end of an epoch)
+        once the global best is within target_tolerance of target_fitness, if
+        given, as GeneticAlgorithm does.
+        Returns:
+            tuple: The global (best_solution, best_fitness).
+        """
+        while self.generation < max_generations:
+            n_generations = min(self.migration_interval, max_generations - self.generation)
+            reports = self._step_all(n_generations)
+            self.generation += n_generations
+
+            self.island_best_fitness = [report["best_fitness"] for report in reports]
+            self.evaluations = sum(report["evaluations"] for report in reports)
+            best_island = int(np.argmin(self.island_best_fitness))
+            if self.island_best_fitness[best_island] < self.best_fitness:
+                self.best_fitness = self.island_best_fitness[best_island]
+                self.best_solution = reports[best_island]["best_solution"]
+
+            self._immigrants = self._migrate(reports)
+            if target_fitness is not None and self.best_fitness <= target_fitness + target_tolerance:
+                break
+        return self.best_solution, self.best_fitness
+
+    def close(self):
+        """Stops the island processes (those that have not already exited after an error)."""
+        for conn, process in zip(self._connections, self._processes):
+            if process.is_alive():
+                try:
+                    conn.send(None)
+                except BrokenPipeError:
+                    pass # The process exited in the meantime
+            conn.close()
+        for process in self._processes:
+            process.join()
+        self._connections, self._processes = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
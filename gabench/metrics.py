@@ -0,0 +1,132 @@
+# This file defines ready-made observers ("sinks") for the per-generation
+# statistics that GeneticAlgorithm reports through add_observer. Each sink is
+# a callable that takes the statistics dict of one generation:
+#
+#     ring = RingBufferSink(capacity=1000)
+#     ga.add_observer(ring)
+#     ga.add_observer(JsonlSink("run.jsonl"))
+#     ga.add_observer(PrometheusSink("ga.prom", labels={"function": "Ackley"}))
+
+import json
+import os
+from collections import deque
+
+class RingBufferSink:
+    """
+    Keeps the statistics of the most recent generations in memory.
+    """
+    def __init__(self, capacity=1000):
+        """
+        Args:
+            capacity (int): How many generations to keep. Older ones are dropped.
+        """
+        self.buffer = deque(maxlen=capacity)
+
+    def __call__(self, stats):
+        self.buffer.append(stats)
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def __iter__(self):
+        return iter(self.buffer)
+
+    def latest(self):
+        """Returns the statistics of the most recent generation, or None."""
+        return self.buffer[-1] if self.buffer else None
+
+class JsonlSink:
+    """
+    Appends the statistics of every generation to a file, one JSON object per
+    line.
+    """
+    def __init__(self, path, every=1, extra=None):
+        """
+        Args:
+            path (str): The file to append to.
+            every (int): Only write every n-th generation.
+            extra (dict): Fields added to every line (e.g. the function name).
+        """
+        self.every = every
+        self.extra = extra or {}
+        self._file = open(path, "a")
+
+    def __call__(self, stats):
+        if stats["generation"] % self.every == 0:
+            self._file.write(json.dumps({**self.extra, **stats}) + "\n")
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class PrometheusSink:
+    """
+    Renders the latest statistics in the Prometheus text exposition format.
+    If a path is given the text is (atomically) rewritten there, which suits
+    the node_exporter textfile collector; otherwise call render() yourself.
+    """
+    GAUGES = {
+        "generation": "Generations completed.",
+        "best_fitness": "Best fitness found so far.",
+        "generation_best": "Best fitness in the latest generation.",
+        "mean_fitness": "Mean fitness of the latest generation.",
+        "std_fitness": "Standard deviation of the latest generation's fitness.",
+        "diversity": "Population diversity (mean gene std / bounds width).",
+    }
+    COUNTERS = {
+        "evaluations": "Objective function evaluations.",
+        "fitness_carried": "Fitness values carried over from unchanged parents.",
+    }
+    STAGES = ["evaluate", "selection", "crossover", "mutation", "generation"]
+
+    def __init__(self, path=None, every=1, labels=None, prefix="ga"):
+        """
+        Args:
+            path (str): File to rewrite with the metrics, or None.
+            every (int): Only rewrite the file every n-th generation.
+            labels (dict): Labels attached to every metric.
+            prefix (str): Prefix of every metric name.
+        """
+        self.path = path
+        self.every = every
+        self.labels = labels or {}
+        self.prefix = prefix
+        self.latest = None
+
+    def __call__(self, stats):
+        self.latest = stats
+        if self.path is not None and stats["generation"] % self.every == 0:
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w") as f:
+                f.write(self.render())
+            os.replace(temp_path, self.path)
+
+    def _labels(self, **extra):
+        labels = {**self.labels, **extra}
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+    def render(self):
+        """Returns the latest statistics as Prometheus exposition text."""
+        if self.latest is None:
+            return ""
+        lines = []
+        for kind, metrics in (("gauge", self.GAUGES), ("counter", self.COUNTERS)):
+            for key, help_text in metrics.items():
+                name = f"{self.prefix}_{key}_total" if kind == "counter" else f"{self.prefix}_{key}"
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.append(f"{name}{self._labels()} {self.latest[key]}")
+        name = f"{self.prefix}_stage_seconds"
+        lines.append(f"# HELP {name} Seconds spent in each stage of the latest generation.")
+        lines.append(f"# TYPE {name} gauge")
+        for stage in self.STAGES:
+            lines.append(f"{name}{self._labels(stage=stage)} {self.latest['time_' + stage]}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,86 @@
+# This file defines MultiRunGA, which evolves many independent runs of the
+# Genetic Algorithm at once. The populations of all runs are stored as one
+# (n_runs, pop_size, dimension) array, so selection, crossover, mutation and
+# (batched) evaluation are each a single vectorized call per generation for
+# all runs, instead of one call per run. This pays off most for small
+# populations, where per-call overhead dominates.
+
+import numpy as np
+
+from .genetic_algorithm import GeneticAlgorithm
+
+class MultiRunGA(GeneticAlgorithm):
+    """
+    Evolves n_runs independent Genetic Algorithm populations in lockstep.
+    Individuals only compete and mate within their own run. The best_fitness
+    and best_solution attributes hold one entry per run, as do
+    run_evaluations, evaluations_to_target and generations_to_target (NaN
+    for runs that have not reached the target). Termination criteria on
+    fitness, stagnation, diversity and evaluations stop the batch once every
+    run meets them.
+    """
+    def __init__(self, objective_func, bounds, dimension, n_runs, pop_size=1000, **kwargs):
+        """
+        Initializes the batch of runs.
+        Args:
+            objective_func (function): The function to be minimized.
+            bounds (tuple): A tuple (min_val, max_val) for the search space.
+            dimension (int): The number of dimensions for the problem.
+            n_runs (int): The number of independent runs.
+            pop_size (int): The size of each run's population.
+            **kwargs: Any other GeneticAlgorithm argument (rates, seed, rng,
+                evaluator, carry_fitness, cache_size, termination criteria).
+        """
+        self.n_runs = n_runs
+        # Offset of each run's first row in the flattened population
+        self._run_offsets = (np.arange(n_runs) * pop_size)[:, None]
+        super().__init__(objective_func, bounds, dimension, pop_size=pop_size, **kwargs)
+        self.best_solution = np.full((n_runs, dimension), np.nan)
+        self.best_fitness = np.full(n_runs, np.inf)
+        self._last_improvement = np.zeros(n_runs, dtype=int)
+        # Individuals evaluated (or looked up in the cache) by each run
+        self.run_evaluations = np.zeros(n_runs, dtype=int)
+        self.evaluations_to_target = np.full(n_runs, np.nan)
+        self.generations_to_target = np.full(n_runs, np.nan)
+
+    @property
+    def _batch_shape(self):
+        return (self.n_runs, self.pop_size)
+
+    def _flat_indices(self, indices):
+        return indices + self._run_offsets
+
+    def _config(self):
+        return {**super()._config(), "n_runs": self.n_runs}
+
+    def state_dict(self):
+        return {**super().state_dict(), "run_evaluations": self.run_evaluations.copy()}
+
+    def load_state_dict(self, state):
+        super().load_state_dict(state)
+        self.run_evaluations = state["run_evaluations"]
+
+    def _evaluate_fitness(self):
+        if self._carried_fitness is None:
+            self.run_evaluations += self.pop_size
+        else:
+            self.run_evaluations += np.count_nonzero(np.isnan(self._carried_fitness), axis=1)
+        return super()._evaluate_fitness()
+
+    def _evaluations_used(self):
+        return self.run_evaluations
+
+    def _track_target(self):
+        newly_reached = self._target_reached() & np.isnan(self.evaluations_to_target)
+        self.evaluations_to_target[newly_reached] = self.run_evaluations[newly_reached]
+        self.generations_to_target[newly_reached] = self.generation + 1
+
+    def _update_best(self, fitness):
+        """Updates each run's best solution found so far."""
+        runs = np.arange(self.n_runs)
+        current_best_idx = np.argmin(fitness, axis=1)
+        current_best = fitness[runs, current_best_idx]
+        improved = current_best < self.best_fitness
+        self.best_fitness[improved] = current_best[improved]
+        self.best_solution[improved] = self.population[runs[improved], current_best_idx[improved]]
+        self._last_improvement[improved] = self.generation
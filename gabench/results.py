@@ -0,0 +1,23 @@
+# This file has the helpers that summarize the runs of an experiment for the
+# results tables printed by generate_results.py, sweep.py and the benchmarks.
+
+import numpy as np
+
+def summarize(results):
+    """
+    Calculates the statistics over all the runs of one experiment.
+
+    Returns:
+        tuple: A tuple containing (best_fitness, worst_fitness, mean_fitness, std_dev).
+    """
+    return np.min(results), np.max(results), np.mean(results), np.std(results)
+
+def format_evaluations_to_target(evaluations):
+    """
+    Formats the mean evaluations-to-target of the runs that reached the
+    optimum, followed by how many runs did, e.g. "4210 (8/10)".
+    """
+    reached = [e for e in evaluations if e is not None]
+    if not reached:
+        return f"- (0/{len(evaluations)})"
+    return f"{np.mean(reached):.0f} ({len(reached)}/{len(evaluations)})"
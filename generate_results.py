@@ -1,82 +1,237 @@
+import argparse
+import os
 import numpy as np
 import time
 
 # Import the necessary components from your other project files
-from genetic_algorithm import GeneticAlgorithm
-from benchmark_functions import FUNCTIONS
+from gabench.genetic_algorithm import TARGET_TOLERANCE, GeneticAlgorithm
+from gabench.multi_run import MultiRunGA
+from gabench.benchmark_functions import FUNCTIONS
+from gabench.history import HistoryRecorder
+from gabench.results import format_evaluations_to_target, summarize
 
-# Experiment Configuration 
+# Experiment Configuration
 NUM_RUNS = 10  # Number of times to run the GA for each function to get an average.
 MAX_GENERATIONS = 500
 POPULATION_SIZE = 100
 DIMENSIONS_TO_TEST = [5, 10]
 
-def run_experiment(func_name, dimension):
+def evolve(ga, early_stop, curve_path=None):
     """
-    Runs the Genetic Algorithm for a given function and dimension for NUM_RUNS times.
-    
+    Runs up to MAX_GENERATIONS generations, stopping early on request. If
+    curve_path is given, the best fitness of every generation (of every run,
+    for a MultiRunGA) is recorded and saved there as an .npz file.
+    """
+    recorder = HistoryRecorder(shape=np.shape(ga.best_fitness)) if curve_path else None
+    for _ in range(MAX_GENERATIONS):
+        ga.run_generation()
+        if recorder is not None:
+            recorder.append(ga.best_fitness)
+        if early_stop and ga.should_stop():
+            break
+    if recorder is not None:
+        recorder.save(curve_path)
+
+def curve_path(curves_dir, func_name, dimension, run=None):
+    """Returns the file a task's convergence curve is saved to, or None."""
+    if curves_dir is None:
+        return None
+    name = f"{func_name}_{dimension}D" + ("" if run is None else f"_run{run + 1}")
+    return os.path.join(curves_dir, name + ".npz")
+
+def run_single(func_name, dimension, seed, early_stop=False, curve_path=None, dtype="float64"):
+    """
+    Runs the Genetic Algorithm once. This is the unit of work handed to the
+    process pool, so it only takes picklable arguments.
+
     Args:
         func_name (str): The name of the benchmark function.
-        dimension (int): The dimension (5 or 10).
-        
+        dimension (int): The dimension of the problem.
+        seed (np.random.SeedSequence): The seed for this run's random stream.
+        early_stop (bool): Stop as soon as the function's optimum is reached.
+        curve_path (str): Where to save the run's convergence curve, if anywhere.
+        dtype (str): The population's float type ("float32" halves its memory).
+
     Returns:
-        tuple: A tuple containing (best_fitness, worst_fitness, mean_fitness, std_dev).
+        dict: The run's best_fitness, evaluations_to_target (None if the
+            optimum was not reached) and cpu_seconds.
     """
-    results = []
+    # CPU time rather than wall time, so oversubscribed workers don't inflate it
+    start_time = time.process_time()
     function_info = FUNCTIONS[func_name]
-    
-    print(f"  Running {func_name} in {dimension}D ({NUM_RUNS} times)...")
-    
-    for i in range(NUM_RUNS):
-        # Initialize the GA instance
-        ga = GeneticAlgorithm(
-            objective_func=function_info["func"],
-            bounds=function_info["bounds"],
-            dimension=dimension,
-            pop_size=POPULATION_SIZE
-        )
-        
-        # Run the GA for the specified number of generations
-        for _ in range(MAX_GENERATIONS):
-            ga.run_generation()
-            
-        # Store the best fitness found in this run
-        results.append(ga.best_fitness)
-        print(f"    Run {i+1}/{NUM_RUNS} complete. Best Fitness: {ga.best_fitness:.4f}")
-
-    # Calculate statistics over all the runs
-    best_fitness = np.min(results)
-    worst_fitness = np.max(results)
-    mean_fitness = np.mean(results)
-    std_dev = np.std(results)
-    
-    return best_fitness, worst_fitness, mean_fitness, std_dev
+
+    # Initialize the GA instance
+    ga = GeneticAlgorithm(
+        objective_func=function_info["func"],
+        bounds=function_info["bounds"],
+        dimension=dimension,
+        pop_size=POPULATION_SIZE,
+        rng=np.random.default_rng(seed),
+        target_fitness=function_info["optimum"],
+        target_tolerance=TARGET_TOLERANCE,
+        dtype=dtype
+    )
+
+    # Run the GA for the specified number of generations
+    evolve(ga, early_stop, curve_path)
+
+    return {
+        "best_fitness": float(ga.best_fitness),
+        "evaluations_to_target": ga.evaluations_to_target,
+        "cpu_seconds": time.process_time() - start_time,
+    }
+
+def run_batched(func_name, dimension, seed, early_stop=False, curve_path=None, dtype="float64"):
+    """
+    Runs all NUM_RUNS runs of one experiment together as a single MultiRunGA.
+
+    Returns:
+        list: One result dict per run, as returned by run_single. The cpu time
+            of the whole batch is reported on the first run.
+    """
+    start_time = time.process_time()
+    function_info = FUNCTIONS[func_name]
+
+    ga = MultiRunGA(
+        objective_func=function_info["func"],
+        bounds=function_info["bounds"],
+        dimension=dimension,
+        n_runs=NUM_RUNS,
+        pop_size=POPULATION_SIZE,
+        rng=np.random.default_rng(seed),
+        target_fitness=function_info["optimum"],
+        target_tolerance=TARGET_TOLERANCE,
+        dtype=dtype
+    )
+    evolve(ga, early_stop, curve_path)
+
+    cpu_seconds = time.process_time() - start_time
+    evaluations_to_target = (ga.evaluations_to_target if function_info["optimum"] is not None
+                             else np.full(NUM_RUNS, np.nan))
+    return [
+        {
+            "best_fitness": float(best_fitness),
+            "evaluations_to_target": None if np.isnan(evaluations) else int(evaluations),
+            "cpu_seconds": cpu_seconds if run == 0 else 0.0,
+        }
+        for run, (best_fitness, evaluations) in enumerate(zip(ga.best_fitness, evaluations_to_target))
+    ]
+
+def build_tasks(master_seed, batched=False, dimensions=DIMENSIONS_TO_TEST):
+    """
+    Lists every task in table order, each with its own independent seed
+    spawned from the master seed. A task is one (function, dimension, run), or
+    one (function, dimension) batch of all runs when batched is set. Seeds
+    depend only on the task's position in this list, so they are the same
+    however the tasks are scheduled.
+    """
+    runs = [None] if batched else range(NUM_RUNS)
+    keys = [(func_name, dim, run)
+            for func_name in FUNCTIONS.keys()
+            for dim in dimensions
+            for run in runs]
+    seeds = master_seed.spawn(len(keys))
+    return list(zip(keys, seeds))
+
+def run_tasks(tasks, workers, early_stop=False, curves_dir=None, dtype="float64"):
+    """
+    Runs all the tasks, serially when workers is 1 and on a process pool
+    otherwise. Results are collected as they finish. With curves_dir, each
+    task also saves its convergence curves there (see curve_path).
+
+    Returns:
+        dict: Maps each (function, dimension, run) to its result dict (see run_single).
+    """
+    results = {}
+
+    def collect(key, result):
+        func_name, dim, run = key
+        if run is not None:
+            results[key] = result
+            print(f"    {func_name} {dim}D run {run+1}/{NUM_RUNS} complete. Best Fitness: {result['best_fitness']:.4f}")
+            return
+        for run, run_result in enumerate(result):
+            results[(func_name, dim, run)] = run_result
+        best = min(run_result["best_fitness"] for run_result in result)
+        print(f"    {func_name} {dim}D all {NUM_RUNS} runs complete. Best Fitness: {best:.4f}")
+
+    def task_func(key):
+        return run_single if key[2] is not None else run_batched
+
+    if workers == 1:
+        for key, seed in tasks:
+            collect(key, task_func(key)(key[0], key[1], seed, early_stop, curve_path(curves_dir, *key), dtype))
+        return results
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(task_func(key), key[0], key[1], seed, early_stop, curve_path(curves_dir, *key), dtype): key
+                   for key, seed in tasks}
+        for future in as_completed(futures):
+            collect(futures[future], future.result())
+    return results
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate the GA results table for all benchmark functions.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes (1 runs everything serially).")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Master seed. The same seed gives the same table for any number of workers.")
+    parser.add_argument("--batched", action="store_true",
+                        help="Evolve all runs of each experiment together as one MultiRunGA.")
+    parser.add_argument("--early-stop", action="store_true",
+                        help="Stop each run as soon as it reaches the function's known optimum.")
+    parser.add_argument("--curves", metavar="DIR", default=None,
+                        help="Save the best-fitness curve of every run to an .npz file in DIR.")
+    parser.add_argument("--dimensions", nargs="+", type=int, default=DIMENSIONS_TO_TEST,
+                        help="Dimensions to test (e.g. 100 1000 for high-dimensional runs).")
+    parser.add_argument("--float32", action="store_true",
+                        help="Store populations as float32 to halve their memory.")
+    return parser.parse_args()
 
 def main():
     """
     Main function to run all experiments and print the results table.
     """
+    args = parse_args()
+    master_seed = np.random.SeedSequence(args.seed)
+
     print("Starting experiment to generate results table...")
+    print(f"Master seed: {master_seed.entropy}, workers: {args.workers}, batched: {args.batched}, early stop: {args.early_stop}")
     start_time = time.time()
-    
-    # Print Table Header 
-    print("\n" + "="*85)
+
+    tasks = build_tasks(master_seed, args.batched, args.dimensions)
+    if args.curves:
+        os.makedirs(args.curves, exist_ok=True)
+    results = run_tasks(tasks, args.workers, args.early_stop, args.curves, "float32" if args.float32 else "float64")
+
+    # Print Table Header
+    print("\n" + "="*105)
     print("### Genetic Algorithm Performance Results")
     print(f"*(Based on {NUM_RUNS} runs per experiment, {MAX_GENERATIONS} generations, {POPULATION_SIZE} population size)*")
-    print("| Function      | Dim | Best Fitness      | Worst Fitness     | Mean Fitness      | Std Deviation     |")
-    print("|---------------|-----|-------------------|-------------------|-------------------|-------------------|")
+    print(f"*(Evals to Target: mean objective evaluations until within {TARGET_TOLERANCE:g} of the optimum, over the runs that got there)*")
+    print("| Function      | Dim | Best Fitness      | Worst Fitness     | Mean Fitness      | Std Deviation     | Evals to Target   |")
+    print("|---------------|-----|-------------------|-------------------|-------------------|-------------------|-------------------|")
 
-    # Run Experiments and Print Table Rows 
+    # Print Table Rows in a fixed order, however the runs were scheduled
     for func_name in FUNCTIONS.keys():
-        for dim in DIMENSIONS_TO_TEST:
-            best, worst, mean, std = run_experiment(func_name, dim)
-            
+        for dim in args.dimensions:
+            cell = [results[(func_name, dim, run)] for run in range(NUM_RUNS)]
+            best, worst, mean, std = summarize([run["best_fitness"] for run in cell])
+            if FUNCTIONS[func_name]["optimum"] is None:
+                to_target = "n/a"
+            else:
+                to_target = format_evaluations_to_target([run["evaluations_to_target"] for run in cell])
+
             # Print the formatted row for the Markdown table
-            print(f"| {func_name:<13} | {dim:<3} | {best:<17.6f} | {worst:<17.6f} | {mean:<17.6f} | {std:<17.6f} |")
+            print(f"| {func_name:<13} | {dim:<3} | {best:<17.6f} | {worst:<17.6f} | {mean:<17.6f} | {std:<17.6f} | {to_target:<17} |")
 
     end_time = time.time()
-    print("="*85)
+    # The serial time is estimated as the sum of the individual run times
+    serial_time = sum(run["cpu_seconds"] for run in results.values())
+    print("="*105)
     print(f"\nAll experiments completed in {end_time - start_time:.2f} seconds.")
+    print(f"Sum of run times (serial estimate): {serial_time:.2f} seconds, speedup: {serial_time / (end_time - start_time):.2f}x")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,284 @@
+# This file is a headless command-line entry point for running parameter
+# sweeps, e.g. on a server with no display. It reads an experiment spec from
+# a JSON, TOML or YAML file, expands it into the grid of every combination of
+# its parameters, and runs the grid on a process pool:
+#
+#     python sweep.py sweep_example.toml --workers 8 --output sweep_results
+#
+# Every finished run is appended to a result store (results.jsonl in the
+# output folder) under a hash of its configuration, so running the same
+# command again skips the runs that are already done and only does the rest.
+# Once the grid is complete, the per-run results are written as CSV and JSON,
+# along with a Markdown table summarizing each configuration over its seeds.
+#
+# The spec lists the values to sweep; any of them may be a single value:
+#
+#     functions = ["Rastrigin", "Ackley"]
+#     dimensions = [10, 30]
+#     pop_sizes = [100, 200]
+#     crossover_rates = [0.6, 0.8]
+#     mutation_rates = [0.1, 0.2]
+#     seeds = [0, 1, 2, 3, 4]
+#     max_generations = 500
+#     early_stop = false
+#
+#     [ga_options]        # passed to every GeneticAlgorithm as is
+#     elitism = 2
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import time
+
+from gabench.benchmark_functions import FUNCTIONS
+from gabench.genetic_algorithm import TARGET_TOLERANCE, GeneticAlgorithm
+from gabench.results import format_evaluations_to_target, summarize
+
+# Spec keys that are swept, with the config field each value goes to
+SWEPT = {
+    "functions": "function",
+    "dimensions": "dimension",
+    "pop_sizes": "pop_size",
+    "crossover_rates": "crossover_rate",
+    "mutation_rates": "mutation_rate",
+    "seeds": "seed",
+}
+# Spec keys that are the same for every run, with their defaults
+FIXED = {
+    "max_generations": 500,
+    "early_stop": False,
+    "ga_options": {},
+}
+DEFAULTS = {
+    "crossover_rates": [0.8],
+    "mutation_rates": [0.2],
+    "seeds": [0],
+}
+# The fields of a configuration that identify a row of the summary table
+TABLE_FIELDS = ["function", "dimension", "pop_size", "crossover_rate", "mutation_rate"]
+RESULT_FIELDS = ["best_fitness", "evaluations", "evaluations_to_target", "generations", "stop_reason", "cpu_seconds"]
+
+def load_spec(path):
+    """
+    Reads an experiment spec from a .json, .toml or .yaml/.yml file.
+    YAML needs the optional PyYAML package.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path) as f:
+            return json.load(f)
+    if extension == ".toml":
+        import tomllib
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    if extension in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("Reading YAML specs needs PyYAML (pip install pyyaml); "
+                              "JSON and TOML specs work without it") from None
+        with open(path) as f:
+            return yaml.safe_load(f)
+    raise ValueError(f"Unknown spec format {extension!r}, expected .json, .toml, .yaml or .yml")
+
+def expand_grid(spec):
+    """
+    Expands a spec into the list of run configurations, one per combination
+    of the swept values, in a fixed order.
+    """
+    unknown = set(spec) - set(SWEPT) - set(FIXED)
+    if unknown:
+        raise ValueError(f"Unknown spec keys: {sorted(unknown)}")
+    for key in ("functions", "dimensions", "pop_sizes"):
+        if key not in spec:
+            raise ValueError(f"The spec must list {key}")
+
+    values = {}
+    for key in SWEPT:
+        value = spec.get(key, DEFAULTS.get(key))
+        values[key] = value if isinstance(value, list) else [value]
+    for func_name in values["functions"]:
+        if func_name not in FUNCTIONS:
+            raise ValueError(f"Unknown function {func_name!r}, expected one of {list(FUNCTIONS)}")
+
+    fixed = {key: spec.get(key, default) for key, default in FIXED.items()}
+    return [{**dict(zip(SWEPT.values(), combination)), **fixed}
+            for combination in itertools.product(*values.values())]
+
+def config_hash(config):
+    """Returns a short, stable hash of a run configuration."""
+    canonical = json.dumps(config, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+def run_config(config):
+    """
+    Runs the GA for one configuration. This is the unit of work handed to the
+    process pool, so it only takes and returns plain data.
+    """
+    start_time = time.process_time()
+    function_info = FUNCTIONS[config["function"]]
+    ga = GeneticAlgorithm(
+        objective_func=function_info["func"],
+        bounds=function_info["bounds"],
+        dimension=config["dimension"],
+        pop_size=config["pop_size"],
+        crossover_rate=config["crossover_rate"],
+        mutation_rate=config["mutation_rate"],
+        seed=config["seed"],
+        target_fitness=function_info["optimum"],
+        **{"target_tolerance": TARGET_TOLERANCE, **config["ga_options"]}
+    )
+    while ga.generation < config["max_generations"]:
+        ga.run_generation()
+        if config["early_stop"] and ga.should_stop():
+            break
+    return {
+        "best_fitness": float(ga.best_fitness),
+        "evaluations": int(ga.evaluations),
+        "evaluations_to_target": ga.evaluations_to_target,
+        "generations": ga.generation,
+        "stop_reason": ga.stop_reason,
+        "cpu_seconds": time.process_time() - start_time,
+    }
+
+class ResultStore:
+    """
+    An append-only JSON Lines file of finished runs, keyed by config hash.
+    Each line is written and flushed as soon as its run finishes, so an
+    interrupted sweep loses at most the runs that were in progress.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.results = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.results[record["hash"]] = record
+        self._file = open(path, "a")
+
+    def __contains__(self, key):
+        return key in self.results
+
+    def add(self, key, config, result):
+        record = {"hash": key, "config": config, "result": result}
+        self.results[key] = record
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def run_sweep(configs, store, workers):
+    """Runs every configuration that is not in the store yet, on a process pool."""
+    pending = [(config_hash(config), config) for config in configs]
+    pending = [(key, config) for key, config in pending if key not in store]
+    print(f"{len(configs)} runs in the grid, {len(configs) - len(pending)} already done, {len(pending)} to run.")
+    if not pending:
+        return
+
+    def report(done, config, result):
+        print(f"    [{done}/{len(pending)}] {config['function']} {config['dimension']}D pop={config['pop_size']} "
+              f"cx={config['crossover_rate']} mut={config['mutation_rate']} seed={config['seed']}: "
+              f"best fitness {result['best_fitness']:.6g}")
+
+    if workers == 1:
+        for done, (key, config) in enumerate(pending, 1):
+            result = run_config(config)
+            store.add(key, config, result)
+            report(done, config, result)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_config, config): (key, config) for key, config in pending}
+        for done, future in enumerate(as_completed(futures), 1):
+            key, config = futures[future]
+            result = future.result()
+            store.add(key, config, result)
+            report(done, config, result)
+
+def markdown_table(rows):
+    """
+    Summarizes the runs of each configuration (over its seeds) as a Markdown
+    table, in grid order.
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(row[field] for field in TABLE_FIELDS), []).append(row)
+
+    lines = [
+        "| Function      | Dim   | Pop     | Cx rate | Mut rate | Runs | Best Fitness      | Worst Fitness     "
+        "| Mean Fitness      | Std Deviation     | Evals to Target   |",
+        "|---------------|-------|---------|---------|----------|------|-------------------|-------------------"
+        "|-------------------|-------------------|-------------------|",
+    ]
+    for (func_name, dim, pop_size, crossover_rate, mutation_rate), runs in groups.items():
+        best, worst, mean, std = summarize([run["best_fitness"] for run in runs])
+        if FUNCTIONS[func_name]["optimum"] is None:
+            to_target = "n/a"
+        else:
+            to_target = format_evaluations_to_target([run["evaluations_to_target"] for run in runs])
+        lines.append(f"| {func_name:<13} | {dim:<5} | {pop_size:<7} | {crossover_rate:<7} | {mutation_rate:<8} | "
+                     f"{len(runs):<4} | {best:<17.6f} | {worst:<17.6f} | {mean:<17.6f} | {std:<17.6f} | {to_target:<17} |")
+    return "\n".join(lines)
+
+def write_outputs(configs, store, output_dir):
+    """
+    Writes results.csv and results.json (one row per run of the grid) and
+    summary.md (the Markdown table), and returns the table.
+    """
+    rows = []
+    for config in configs:
+        record = store.results[config_hash(config)]
+        row = {field: config[field] for field in SWEPT.values()}
+        row.update({"max_generations": config["max_generations"], "hash": record["hash"]})
+        row.update({field: record["result"][field] for field in RESULT_FIELDS})
+        rows.append(row)
+
+    with open(os.path.join(output_dir, "results.json"), "w") as f:
+        json.dump(rows, f, indent=2)
+    with open(os.path.join(output_dir, "results.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    table = markdown_table(rows)
+    with open(os.path.join(output_dir, "summary.md"), "w") as f:
+        f.write(table + "\n")
+    return table
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run a GA parameter sweep from an experiment spec, without the GUI.")
+    parser.add_argument("spec", help="Experiment spec (.json, .toml, or .yaml/.yml with PyYAML installed).")
+    parser.add_argument("--output", default="sweep_results",
+                        help="Folder for the result store and the CSV/JSON/Markdown outputs.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (1 runs everything serially).")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    configs = expand_grid(load_spec(args.spec))
+    os.makedirs(args.output, exist_ok=True)
+
+    start_time = time.time()
+    with ResultStore(os.path.join(args.output, "results.jsonl")) as store:
+        run_sweep(configs, store, args.workers)
+        table = write_outputs(configs, store, args.output)
+    print("\n" + table)
+    print(f"\nDone in {time.time() - start_time:.2f} seconds. Results are in {args.output}/ "
+          "(results.csv, results.json, summary.md).")
+
+if __name__ == "__main__":
+    main()